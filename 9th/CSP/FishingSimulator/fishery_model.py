@@ -0,0 +1,209 @@
+# Headless population model for the Fishing Simulator.
+# The fish population, the community's food and the pollution level are kept
+# in a small immutable FisheryState, and FisheryModel turns one state into the
+# next without touching the screen. fs.py calls into the model for catches and
+# for feeding the community, so the numbers on screen always come from here.
+# Given a SpeciesTable, the model splits the fish into species and hands
+# reproduction to fishery_species.MultiSpeciesModel, which uses this model's
+# pollution numbers. The game's model does this, so run() plays the same
+# dynamics as the game. Without species it is one population, and with a
+# single default species both give the same numbers.
+# Because nothing is drawn, years of daily steps can be simulated in a blink:
+#
+#   python fishery_model.py --days 20 --catch 5 --size 5 --pollution 100
+
+import argparse
+from collections import namedtuple
+
+import numpy as np
+
+# species_population is None for a single population, or an array with the
+# fish of every species (fish_population is then their total)
+FisheryState = namedtuple('FisheryState', ['fish_population', 'food_level', 'pollution_level',
+                                           'day', 'species_population'], defaults=[None])
+
+def new_state(fish_population=30, food_level=100, pollution_level=0, day=1, species_population=None):
+    """Starting state of a game (the same numbers create_game uses). With a
+    species model and no species_population, the fish are split between the
+    species when the model first needs them."""
+    return FisheryState(fish_population, food_level, pollution_level, day, species_population)
+
+def size_scale(fish_size):
+    """Fish size (30 to 49.8 pixels) back to the 1-10 scale it was drawn from"""
+    return (fish_size - 30) / 2.2 + 1
+
+class FisheryModel:
+    """Rules for how the fish and the community change from day to day"""
+    def __init__(self, base_growth_rate=0.15, carrying_capacity=100,
+                 pollution_growth_factor=0.6, min_pollution_factor=0.4,
+                 pollution_mortality=0.20, max_pollution=500,
+                 food_decrease_base=50, food_per_missing_fish=0.5,
+                 max_food=100, max_food_per_fish=15, target_days=20, species=None):
+        self.base_growth_rate = base_growth_rate
+        self.carrying_capacity = carrying_capacity
+        self.pollution_growth_factor = pollution_growth_factor  # Growth lost at full pollution
+        self.min_pollution_factor = min_pollution_factor
+        self.pollution_mortality = pollution_mortality  # Fish lost per day at full pollution
+        self.max_pollution = max_pollution
+        self.food_decrease_base = food_decrease_base
+        self.food_per_missing_fish = food_per_missing_fish
+        self.max_food = max_food
+        self.max_food_per_fish = max_food_per_fish
+        self.target_days = target_days
+
+        # Imported here because fishery_species builds on this module
+        self.species_model = None
+        if species is not None:
+            from fishery_species import MultiSpeciesModel
+            self.species_model = MultiSpeciesModel(species, self)
+
+    def species_populations(self, state):
+        """Fish of every species (species models only)"""
+        if state.species_population is not None:
+            return state.species_population
+        return self.species_model.split_population(state.fish_population)
+
+    def next_catch_species(self, state):
+        """Species a headless player catches next: the most common one, or
+        None for a single population"""
+        if self.species_model is None:
+            return None
+        return self.species_model.most_common(self.species_populations(state))
+
+    def food_from_fish(self, fish_size):
+        """How much food one caught fish gives the community"""
+        return min(self.max_food_per_fish, 2 + (size_scale(fish_size) - 1) * 1.5)
+
+    def catch_fish(self, state, fish_size, species=None):
+        """A fish of this size (and species, with a species model) is put in the bucket"""
+        if self.species_model is None:
+            population = max(0, state.fish_population - 1)
+        else:
+            # Take the fish from its own species
+            populations = self.species_populations(state).copy()
+            if species is None:
+                species = self.species_model.most_common(populations)
+            populations[species] = max(0, populations[species] - 1)
+            population = int(populations.sum())
+            state = state._replace(species_population=populations)
+        if population <= 0:
+            # The last fish is gone, so there is nothing left to feed anyone
+            return state._replace(fish_population=population)
+        food = min(self.max_food, state.food_level + self.food_from_fish(fish_size))
+        return state._replace(fish_population=population, food_level=food)
+
+    def growth_rate(self, state, caught_fish_sizes):
+        """Daily growth rate after pollution and the penalty for catching big fish"""
+        pollution = state.pollution_level / self.max_pollution
+        rate = self.base_growth_rate * max(self.min_pollution_factor,
+                                           1 - pollution * self.pollution_growth_factor)
+        if not caught_fish_sizes:
+            return rate
+
+        avg_size = sum(caught_fish_sizes) / len(caught_fish_sizes)
+        size_penalty = max(0, (size_scale(avg_size) - 5) * 0.04)
+
+        # Population-dependent minimum growth rate
+        min_growth_rate = max(0.05, 0.15 - (state.fish_population / 50) * 0.10)
+        return max(min_growth_rate, rate - size_penalty)
+
+    def reproduce(self, state, caught_fish_sizes, caught_species=None):
+        """Logistic growth minus the fish killed by pollution. With a species
+        model, caught_species gives the species of every caught fish."""
+        if self.species_model is not None:
+            return self.reproduce_species(state, caught_fish_sizes, caught_species or [])
+
+        population = state.fish_population
+        reproduction = (population * self.growth_rate(state, caught_fish_sizes) *
+                        (1 - population / self.carrying_capacity))
+        mortality_rate = (state.pollution_level / self.max_pollution) * self.pollution_mortality
+        mortality = int(population * mortality_rate)
+        return state._replace(fish_population=max(0, int(population + reproduction - mortality)))
+
+    def reproduce_species(self, state, caught_fish_sizes, caught_species):
+        """reproduce() for every species at once (see fishery_species.py)"""
+        count = len(self.species_model.species)
+        caught_counts = np.bincount(caught_species, minlength=count)
+        caught_sizes = np.zeros(count)
+        for species, fish_size in zip(caught_species, caught_fish_sizes):
+            caught_sizes[species] += fish_size  # One fish at a time, like the game
+        populations = self.species_model.reproduce(self.species_populations(state), state.pollution_level,
+                                                   caught_counts, caught_sizes)
+        return state._replace(fish_population=int(populations.sum()), species_population=populations)
+
+    def feed(self, state, caught_fish_today):
+        """The community eats; every fish short of food_decrease_base costs food"""
+        fish_deficit = max(0, self.food_decrease_base - caught_fish_today)
+        return state._replace(food_level=max(0, state.food_level - fish_deficit * self.food_per_missing_fish))
+
+    def outcome(self, state):
+        """'starved', 'polluted', 'won' or None while the game goes on,
+        checked in the same order as check_game_over"""
+        if state.food_level <= 0:
+            return 'starved'
+        if state.pollution_level >= self.max_pollution:
+            return 'polluted'
+        if state.day >= self.target_days:
+            return 'won'
+        return None
+
+    def step(self, state, harvest):
+        """One whole day: catch every fish in harvest (a list of fish sizes),
+        then reproduce, feed the community and move on to the next day.
+        With species, every fish comes from the most common species.
+        Game over checks are left to the caller (see run)."""
+        caught_species = []
+        for fish_size in harvest:
+            species = self.next_catch_species(state)
+            state = self.catch_fish(state, fish_size, species)
+            caught_species.append(species)
+        state = self.reproduce(state, harvest, caught_species)
+        state = self.feed(state, len(harvest))
+        return state._replace(day=state.day + 1)
+
+    def run(self, state, harvests):
+        """Play days in a row, one harvest per day, with the same checks as
+        the game. Returns (final state, outcome); the outcome is 'extinct'
+        when a catch takes the last fish, or None if the harvests ran out."""
+        for harvest in harvests:
+            caught_species = []
+            for fish_size in harvest:
+                species = self.next_catch_species(state)
+                state = self.catch_fish(state, fish_size, species)
+                caught_species.append(species)
+                if state.fish_population <= 0:
+                    return state, 'extinct'
+
+            if self.outcome(state):
+                return state, self.outcome(state)
+            state = self.reproduce(state, harvest, caught_species)
+            state = self.feed(state, len(harvest))
+            if self.outcome(state):
+                return state, self.outcome(state)
+            state = state._replace(day=state.day + 1)
+        return state, None
+
+def main():
+    parser = argparse.ArgumentParser(description='Simulate the Fishing Simulator population model.')
+    parser.add_argument('--days', type=int, default=20)
+    parser.add_argument('--catch', type=int, default=5, help='fish caught every day')
+    parser.add_argument('--size', type=int, default=5, help='size of every caught fish (1-10)')
+    parser.add_argument('--pollution', type=float, default=0)
+    parser.add_argument('--population', type=int, default=30)
+    parser.add_argument('--single-species', action='store_true',
+                        help='one population instead of the species the game uses')
+    args = parser.parse_args()
+
+    if args.single_species:
+        model = FisheryModel()
+    else:
+        from fishery_species import DEFAULT_SPECIES
+        model = FisheryModel(species=DEFAULT_SPECIES)
+    state = new_state(fish_population=args.population, pollution_level=args.pollution)
+    fish_size = 30 + (args.size - 1) * 2.2
+    state, result = model.run(state, [[fish_size] * args.catch] * args.days)
+    print(f'day {state.day}: {state.fish_population} fish, food {state.food_level:.1f}%, '
+          f'outcome: {result or "still playing"}')
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,130 @@
+# Multi-species fish populations for the Fishing Simulator.
+# Every species has its own growth rate, carrying capacity, size range and
+# sensitivity to pollution. The numbers are stored as NumPy arrays with one
+# entry per species (a SpeciesTable), and a day of reproduction for every
+# species is one competitive Lotka-Volterra step done with array operations:
+#
+#   N' = N + r * N * (1 - (A @ N) / K) - pollution deaths
+#
+# where A says how much each species crowds the others. The pollution numbers
+# come from the FisheryModel the species belong to, and FisheryModel hands its
+# reproduction over to this module when it is given a SpeciesTable (as the
+# game's model is). With one species and the default numbers this is exactly
+# the single-population FisheryModel.reproduce, so adding species doesn't
+# change how a single population behaves.
+
+import numpy as np
+
+from fishery_model import FisheryModel, size_scale
+
+class SpeciesTable:
+    """Per-species numbers, one array entry per species"""
+    def __init__(self, names, growth_rate, carrying_capacity, min_size, max_size,
+                 breeding_size, pollution_sensitivity, start_population, color,
+                 competition=None):
+        self.names = list(names)
+        self.growth_rate = np.asarray(growth_rate, dtype=np.float64)
+        self.carrying_capacity = np.asarray(carrying_capacity, dtype=np.float64)
+        self.min_size = np.asarray(min_size, dtype=np.int64)  # Size range on the 1-10 scale
+        self.max_size = np.asarray(max_size, dtype=np.int64)
+        self.breeding_size = np.asarray(breeding_size, dtype=np.float64)  # Catching bigger hurts growth
+        self.pollution_sensitivity = np.asarray(pollution_sensitivity, dtype=np.float64)
+        self.start_population = np.asarray(start_population, dtype=np.int64)
+        self.color = list(color)  # Index into fs.FISH_COLOR_SCHEMES
+
+        # competition[i][j]: how much one fish of species j crowds species i
+        if competition is None:
+            competition = np.eye(len(self.names))
+        self.competition = np.asarray(competition, dtype=np.float64)
+
+    @classmethod
+    def from_rows(cls, rows, competition=None):
+        """Build a table from (name, growth rate, capacity, min size, max size,
+        breeding size, pollution sensitivity, start population, color) rows"""
+        columns = list(zip(*rows))
+        return cls(*columns, competition=competition)
+
+    def __len__(self):
+        return len(self.names)
+
+# Three species that start out as the old single population of 30 fish
+DEFAULT_SPECIES = SpeciesTable.from_rows([
+    # name      growth  capacity  sizes  breeding  pollution  start  color
+    ('perch',   0.18,   50,       1, 6,  4,        1.0,       15,    0),
+    ('bass',    0.12,   35,       4, 10, 7,        0.7,       10,    4),
+    ('trout',   0.15,   20,       3, 8,  5,        1.6,       5,     2),
+], competition=[
+    [1.0, 0.3, 0.2],
+    [0.2, 1.0, 0.2],
+    [0.3, 0.3, 1.0],
+])
+
+class MultiSpeciesModel:
+    """Daily reproduction for every species in a SpeciesTable at once.
+    Populations can also be a 2-D array with one row per game, in which case
+    pollution_level needs one entry per row (shape (games, 1))."""
+    def __init__(self, species, model=None):
+        self.species = species
+        self.model = model or FisheryModel()  # Pollution numbers are the model's
+
+    def start_populations(self):
+        return self.species.start_population.copy()
+
+    def split_population(self, total):
+        """Split a total number of fish between the species in the same
+        proportions as their start populations (the rest goes to the most
+        common one)"""
+        start = self.species.start_population
+        total = np.asarray(total, dtype=np.int64)
+        populations = np.floor(total[..., None] * (start / start.sum())).astype(np.int64)
+        populations[..., int(np.argmax(start))] += total - populations.sum(axis=-1)
+        return populations
+
+    def most_common(self, populations):
+        """Species with the most fish (the lowest index on a tie)"""
+        return int(np.argmax(populations))
+
+    def growth_rates(self, populations, pollution_level, caught_counts, caught_size_totals):
+        """Growth rate of each species after pollution and the penalty for
+        catching its breeding-size fish. caught_size_totals are in pixels."""
+        species = self.species
+        model = self.model
+        pollution = pollution_level / model.max_pollution
+        rates = species.growth_rate * np.maximum(
+            model.min_pollution_factor,
+            1 - pollution * model.pollution_growth_factor * species.pollution_sensitivity)
+
+        caught = caught_counts > 0
+        avg_size = np.divide(caught_size_totals, caught_counts,
+                             out=np.zeros(np.shape(caught_size_totals)), where=caught)
+        size_penalty = np.maximum(0, (size_scale(avg_size) - species.breeding_size) * 0.04)
+
+        # Minimum growth rate that shrinks as the species recovers
+        min_rates = species.growth_rate * np.maximum(
+            1 / 3, 1 - (populations / (species.carrying_capacity / 2)) * (2 / 3))
+        return np.where(caught, np.maximum(min_rates, rates - size_penalty), rates)
+
+    def reproduce(self, populations, pollution_level, caught_counts, caught_size_totals):
+        """One day of competitive logistic growth minus pollution deaths.
+        Returns the new whole-number population of every species."""
+        species = self.species
+        populations = np.asarray(populations, dtype=np.float64)
+        rates = self.growth_rates(populations, pollution_level, caught_counts, caught_size_totals)
+        crowding = populations @ species.competition.T
+        reproduction = populations * rates * (1 - crowding / species.carrying_capacity)
+
+        mortality_rates = ((pollution_level / self.model.max_pollution) * self.model.pollution_mortality *
+                           species.pollution_sensitivity)
+        mortality = np.floor(populations * mortality_rates)
+        return np.maximum(0, np.trunc(populations + reproduction - mortality)).astype(np.int64)
+
+    def pick_species(self, populations, rng):
+        """Species of the next fish to swim by, more likely the more common it is"""
+        weights = [int(count) for count in populations]
+        if sum(weights) <= 0:
+            return rng.randrange(len(self.species))
+        return rng.choices(range(len(self.species)), weights=weights)[0]
+
+    def random_size_scale(self, index, rng):
+        """Size (1-10 scale) of a new fish of this species"""
+        return rng.randint(int(self.species.min_size[index]), int(self.species.max_size[index]))
@@ -0,0 +1,279 @@
+# Parameter sweep for the Fishing Simulator population model.
+# Plays the FisheryModel rules for every point of a grid of
+# (daily catch, catch size, pollution level, starting population) at once.
+# Every grid point is one entry in a set of NumPy arrays, and each day is a
+# handful of whole-array operations, so millions of games take a second or
+# two. The result is a CSV with one row per point, plus a heatmap of how
+# often the community survives to target_days.
+#
+# The sweep reads its numbers from a FisheryModel, so the tuning flags below
+# change the same parameters the game uses. By default that is the game's own
+# model, with the fish split into species (see fishery_species.py): the
+# starting population is shared out like the game's, and every caught fish
+# comes from the most common species, as in FisheryModel.run. Use
+# --single-species for the one-population model. Pollution is held at a fixed
+# level for the whole game (no trash comes or goes).
+#
+# Example:
+#   python fishery_sweep.py --carrying-capacity 120 --csv sweep.csv --heatmap sweep.png
+#
+# Needs NumPy; the heatmap also needs matplotlib.
+
+import argparse
+import random
+import time
+
+import numpy as np
+
+from fishery_model import FisheryModel, new_state
+from fishery_species import DEFAULT_SPECIES
+
+# Outcome codes used in the result arrays
+PLAYING, WON, STARVED, POLLUTED, EXTINCT = range(5)
+OUTCOME_NAMES = ['playing', 'won', 'starved', 'polluted', 'extinct']
+
+def fish_size(size_scale):
+    """Pixel size of a fish on the 1-10 scale, as create_fish draws it"""
+    return 30 + (size_scale - 1) * 2.2
+
+def make_grid(catches, sizes, pollutions, populations):
+    """Every combination of the four axes, flattened into 1-D arrays"""
+    axes = np.meshgrid(catches, sizes, pollutions, populations, indexing='ij')
+    return [axis.ravel().astype(np.float64) for axis in axes]
+
+def sweep(model, catches, sizes, pollutions, populations, food_level=100):
+    """Play model.target_days days for every grid point.
+    Every day the same number of fish of the same size are caught.
+    Returns a dict of 1-D arrays (inputs and results, one entry per point)."""
+    if model.species_model is not None:
+        return sweep_species(model, catches, sizes, pollutions, populations, food_level)
+    catch, size_scale, pollution, population = make_grid(catches, sizes, pollutions, populations)
+    start_population = population.copy()
+    size = fish_size(size_scale)
+    food = np.full(catch.shape, float(food_level))
+    day = np.ones(catch.shape, dtype=np.int16)
+    outcome = np.full(catch.shape, PLAYING, dtype=np.int8)
+    max_catch = int(catch.max()) if catch.size else 0
+
+    # Numbers that are the same every day
+    food_per_fish = np.minimum(model.max_food_per_fish, 2 + (size_scale - 1) * 1.5)
+    base_rate = model.base_growth_rate * np.maximum(
+        model.min_pollution_factor,
+        1 - (pollution / model.max_pollution) * model.pollution_growth_factor)
+    # Added up one fish at a time, like sum() in the model, so the rounding matches
+    total_size = np.zeros(catch.shape)
+    for k in range(max_catch):
+        total_size += np.where(k < catch, size, 0)
+    avg_size = np.divide(total_size, catch, out=np.zeros(catch.shape), where=catch > 0)
+    size_penalty = np.maximum(0, ((avg_size - 30) / 2.2 + 1 - 5) * 0.04)
+    mortality_rate = (pollution / model.max_pollution) * model.pollution_mortality
+    fish_deficit = np.maximum(0, model.food_decrease_base - catch)
+
+    def finish(mask, code):
+        outcome[mask & (outcome == PLAYING)] = code
+
+    def check(playing):
+        finish(playing & (food <= 0), STARVED)
+        finish(playing & (pollution >= model.max_pollution), POLLUTED)
+        finish(playing & (day >= model.target_days), WON)
+
+    while True:
+        playing = outcome == PLAYING
+        if not playing.any():
+            break
+
+        # Catches: the game ends as soon as the last fish is taken
+        extinct = playing & (population - catch <= 0) & (catch > 0)
+        population = np.where(playing, np.maximum(0, population - catch), population)
+        finish(extinct, EXTINCT)
+        playing &= ~extinct
+        food = np.where(playing, np.minimum(model.max_food, food + catch * food_per_fish), food)
+
+        check(playing)
+        playing = outcome == PLAYING
+
+        # Reproduction and mortality
+        min_rate = np.maximum(0.05, 0.15 - (population / 50) * 0.10)
+        rate = np.where(catch > 0, np.maximum(min_rate, base_rate - size_penalty), base_rate)
+        reproduction = population * rate * (1 - population / model.carrying_capacity)
+        mortality = np.floor(population * mortality_rate)
+        grown = np.maximum(0, np.trunc(population + reproduction - mortality))
+        population = np.where(playing, grown, population)
+
+        # Feeding the community
+        food = np.where(playing, np.maximum(0, food - fish_deficit * model.food_per_missing_fish), food)
+
+        check(playing)
+        day += (outcome == PLAYING)
+
+    return {'catch': catch, 'size': size_scale, 'pollution': pollution,
+            'start_population': start_population,
+            'outcome': outcome, 'final_population': population, 'food': food, 'day': day}
+
+def sweep_species(model, catches, sizes, pollutions, populations, food_level=100):
+    """sweep() for a model with species. The population of every species is
+    a column of a (points, species) array, and each day's catches are taken
+    one fish at a time from the most common species."""
+    catch, size_scale, pollution, population = make_grid(catches, sizes, pollutions, populations)
+    start_population = population.copy()
+    species_model = model.species_model
+    species = species_model.split_population(population)
+    rows = np.arange(catch.size)
+    size = fish_size(size_scale)
+    food = np.full(catch.shape, float(food_level))
+    day = np.ones(catch.shape, dtype=np.int16)
+    outcome = np.full(catch.shape, PLAYING, dtype=np.int8)
+    max_catch = int(catch.max()) if catch.size else 0
+
+    food_per_fish = np.minimum(model.max_food_per_fish, 2 + (size_scale - 1) * 1.5)
+    fish_deficit = np.maximum(0, model.food_decrease_base - catch)
+    pollution_column = pollution[:, None]
+
+    def finish(mask, code):
+        outcome[mask & (outcome == PLAYING)] = code
+
+    def check(playing):
+        finish(playing & (food <= 0), STARVED)
+        finish(playing & (pollution >= model.max_pollution), POLLUTED)
+        finish(playing & (day >= model.target_days), WON)
+
+    while True:
+        playing = outcome == PLAYING
+        if not playing.any():
+            break
+
+        # Catches, one fish at a time: the game ends as soon as the last fish is taken
+        caught_counts = np.zeros(species.shape, dtype=np.int64)
+        caught_sizes = np.zeros(species.shape)
+        for k in range(max_catch):
+            catching = playing & (k < catch)
+            target = np.argmax(species, axis=1)
+            taken = rows[catching], target[catching]
+            species[taken] = np.maximum(0, species[taken] - 1)
+            caught_counts[taken] += 1
+            caught_sizes[taken] += size[catching]
+            left = species.sum(axis=1)
+            extinct = catching & (left <= 0)
+            finish(extinct, EXTINCT)
+            playing &= ~extinct
+            fed = catching & ~extinct
+            food = np.where(fed, np.minimum(model.max_food, food + food_per_fish), food)
+        population = species.sum(axis=1).astype(np.float64)
+
+        check(playing)
+        playing = outcome == PLAYING
+
+        # Reproduction and mortality of every species
+        grown = species_model.reproduce(species, pollution_column, caught_counts, caught_sizes)
+        species = np.where(playing[:, None], grown, species)
+        population = species.sum(axis=1).astype(np.float64)
+
+        # Feeding the community
+        food = np.where(playing, np.maximum(0, food - fish_deficit * model.food_per_missing_fish), food)
+
+        check(playing)
+        day += (outcome == PLAYING)
+
+    return {'catch': catch, 'size': size_scale, 'pollution': pollution,
+            'start_population': start_population,
+            'outcome': outcome, 'final_population': population, 'food': food, 'day': day,
+            'final_species': species}
+
+def write_csv(results, path):
+    columns = ['catch', 'size', 'pollution', 'start_population', 'outcome',
+               'final_population', 'food', 'day']
+    table = np.column_stack([results[name] for name in columns])
+    np.savetxt(path, table, delimiter=',', header=','.join(columns), comments='',
+               fmt=['%d', '%d', '%g', '%d', '%d', '%d', '%.2f', '%d'])
+
+def survival_table(results, catches, sizes, pollutions):
+    """Fraction of games won for each (daily catch, pollution) pair,
+    over every catch size and starting population"""
+    won = (results['outcome'] == WON).reshape(len(catches), len(sizes), len(pollutions), -1)
+    return won.mean(axis=(1, 3))
+
+def write_heatmap(table, catches, pollutions, path):
+    import matplotlib
+    matplotlib.use('Agg')
+    import matplotlib.pyplot as plt
+
+    figure, axes = plt.subplots(figsize=(8, 4))
+    image = axes.imshow(table, aspect='auto', origin='lower', cmap='viridis', vmin=0, vmax=1,
+                        extent=[pollutions[0], pollutions[-1], catches[0] - 0.5, catches[-1] + 0.5])
+    axes.set_xlabel('pollution level')
+    axes.set_ylabel('fish caught per day')
+    axes.set_title('Share of games that reach target_days')
+    figure.colorbar(image, ax=axes)
+    figure.savefig(path, dpi=120, bbox_inches='tight')
+
+def check_against_model(model, results, samples, food_level=100):
+    """Replay random grid points with the scalar FisheryModel.run and count
+    how many disagree with the sweep (for species models, on any species)"""
+    rng = random.Random(0)
+    codes = {None: PLAYING, 'won': WON, 'starved': STARVED, 'polluted': POLLUTED, 'extinct': EXTINCT}
+    mismatches = 0
+    for i in rng.sample(range(results['outcome'].size), min(samples, results['outcome'].size)):
+        harvest = [fish_size(results['size'][i])] * int(results['catch'][i])
+        state = new_state(int(results['start_population'][i]), food_level, results['pollution'][i])
+        state, outcome = model.run(state, [harvest] * model.target_days)
+        if (codes[outcome] != results['outcome'][i] or
+                state.fish_population != results['final_population'][i]):
+            mismatches += 1
+        elif 'final_species' in results and not np.array_equal(
+                model.species_populations(state), results['final_species'][i]):
+            mismatches += 1
+    return mismatches
+
+def main():
+    parser = argparse.ArgumentParser(description='Sweep the Fishing Simulator population model.')
+    parser.add_argument('--max-catch', type=int, default=5, help='daily catches from 0 up to this')
+    parser.add_argument('--pollution-step', type=float, default=5)
+    parser.add_argument('--max-population', type=int, default=200)
+    parser.add_argument('--single-species', action='store_true',
+                        help='sweep one population instead of the species the game uses')
+    parser.add_argument('--base-growth-rate', type=float, default=0.15,
+                        help='single-species only (species have their own rates)')
+    parser.add_argument('--carrying-capacity', type=float, default=100,
+                        help='single-species only (species have their own capacities)')
+    parser.add_argument('--pollution-growth-factor', type=float, default=0.6)
+    parser.add_argument('--pollution-mortality', type=float, default=0.20)
+    parser.add_argument('--target-days', type=int, default=20)
+    parser.add_argument('--csv', default='fishery_sweep.csv')
+    parser.add_argument('--heatmap', default='fishery_sweep.png')
+    parser.add_argument('--check', type=int, default=0, help='replay this many points with FisheryModel')
+    args = parser.parse_args()
+
+    model = FisheryModel(base_growth_rate=args.base_growth_rate,
+                         carrying_capacity=args.carrying_capacity,
+                         pollution_growth_factor=args.pollution_growth_factor,
+                         pollution_mortality=args.pollution_mortality,
+                         target_days=args.target_days,
+                         species=None if args.single_species else DEFAULT_SPECIES)
+    catches = np.arange(0, args.max_catch + 1)
+    sizes = np.arange(1, 11)
+    pollutions = np.arange(0, model.max_pollution, args.pollution_step)
+    populations = np.arange(1, args.max_population + 1)
+
+    start = time.time()
+    results = sweep(model, catches, sizes, pollutions, populations)
+    elapsed = time.time() - start
+    points = results['outcome'].size
+    print(f'{points} games in {elapsed:.2f}s')
+    for code, name in enumerate(OUTCOME_NAMES):
+        print(f'{name:>10}: {np.count_nonzero(results["outcome"] == code) / points:7.2%}')
+
+    if args.csv:
+        write_csv(results, args.csv)
+        print(f'wrote {args.csv}')
+    if args.heatmap:
+        try:
+            write_heatmap(survival_table(results, catches, sizes, pollutions), catches, pollutions, args.heatmap)
+            print(f'wrote {args.heatmap}')
+        except ImportError:
+            print('matplotlib is not installed, skipping the heatmap')
+    if args.check:
+        print(f'{check_against_model(model, results, args.check)} of {args.check} points '
+              f'disagree with FisheryModel.run')
+
+if __name__ == '__main__':
+    main()
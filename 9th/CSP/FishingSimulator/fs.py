@@ -13,6 +13,13 @@
 from cmu_graphics import *
 import random
 import math
+import time
+
+from fishery_model import FisheryModel, FisheryState
+from fishery_species import DEFAULT_SPECIES
+from spatial_grid import SpatialGrid
+from stat_labels import StatLabels
+from swimmers import SwimmerArrays
 
 def create_game():
     game = Group()
@@ -24,10 +31,28 @@ def create_game():
     game.day = 1
     game.target_days = 20
     game.game_over = False
-    game.time = 0
+    game.time = 0  # Simulation steps since the game started
+
+    # Fixed-timestep clock: the simulation always advances in steps of
+    # step_length seconds, however often frames are actually drawn
+    game.step_length = 1 / 30
+    game.clock_backlog = 0  # Seconds of real time not simulated yet
+    game.last_frame_time = None
+    game.max_catch_up_steps = 5  # More than this behind and the rest is skipped
+    game.fast_forward_steps = 300  # Steps skipped by the F key (10 seconds)
     game.caught_fish_today = 0
     game.caught_fish_sizes = []
 
+    # Population and food rules (see fishery_model.py), with the fish split
+    # into species (see fishery_species.py); fish_population is their total
+    game.model = FisheryModel(food_decrease_base=game.food_decrease_base,
+                              target_days=game.target_days,
+                              species=DEFAULT_SPECIES)
+    game.species_model = game.model.species_model
+    game.species_population = game.species_model.start_populations()
+    game.fish_population = int(game.species_population.sum())
+    game.caught_species = []  # Species of every fish caught today
+
     # Mouse position tracking
     game.mouse_x = 200
     game.mouse_y = 200
@@ -43,10 +68,20 @@ def create_game():
     # Trash and fish visualization
     game.trash = Group()
     game.trash_timer = 0
+    game.max_trash = 2
+    game.trash_slots = [None] * game.max_trash  # Trash group in each motion slot
+    game.trash_motion = SwimmerArrays(game.max_trash)
     game.pollution_level = 0
-    game.visible_fish = []
     game.max_visible_fish = 3
 
+    # Spatial indexes over the water, so clicks only check nearby swimmers
+    game.fish_index = SpatialGrid(cell_size=50)
+    game.trash_index = SpatialGrid(cell_size=50)
+
+    # Fish spawn schedule
+    game.next_spawn_time = 0  # Step when the next fish may spawn
+    game.max_spawns_per_step = 1
+
     # Create UI elements
     game.background = Group()
 
@@ -205,8 +240,10 @@ def create_game():
         Label('Day: 1', game.stats.left_position, 20),
         Label('Fish Population: 30', game.stats.left_position, 40),
         Label('Food Level: 100%', game.stats.left_position, 60),
-        Label('Caught Today: 0/5', game.stats.left_position, 80)
+        Label('Caught Today: 0/5', game.stats.left_position, 80),
+        Label('Pollution: 0%', game.stats.left_position, 100)
     )
+    game.stat_labels = StatLabels(game.stats.children, game.stats.left_position)
 
     # Game over screen
     game_over_overlay = Rect(0, 0, 400, 400, fill=rgb(0, 0, 0), opacity=60)
@@ -217,13 +254,28 @@ def create_game():
         Label('', 200, 240, fill='white'),
         Label('Press R to restart', 200, 280, fill='white')
     )
+    # Fixed pool of fish sprites, reused for every fish that spawns
+    game.fish_pool_size = 3  # Never more than max_visible_fish on screen
+    game.fish_pool = [create_fish_sprite(slot) for slot in range(game.fish_pool_size)]
+    game.fish_motion = SwimmerArrays(game.fish_pool_size)  # Indexed by pool slot
+
+    # Everything the game draws lives inside game, so a restart can take the
+    # whole old game off the canvas at once (see destroy_game)
+    game.add(game.background, game.bucket, game.hunger_bar, game.rod, game.line,
+             game.instructions, game.stats, *game.fish_pool, game.game_over_screen)
+
     game.game_over_screen.visible = False
     game.game_over_screen.toFront()
 
     return game
 
-def create_fish_colors():
-    """Create a random fish color scheme"""
+def destroy_game(game):
+    """Remove every shape of a game from the canvas"""
+    game.clear()
+    app.group.remove(game)
+
+def make_fish_color_schemes():
+    """Build every (main, belly) fish color pair once"""
     # Base colors for fish
     base_colors = [
         rgb(255, 128, 0),  # Orange
@@ -232,12 +284,147 @@ def create_fish_colors():
         rgb(255, 99, 71),  # Tomato red
         rgb(255, 140, 0),  # Dark orange
     ]
-    main_color = random.choice(base_colors)
-    # Make belly color lighter
-    belly_color = rgb(min(255, main_color.red + 40),
-                     min(255, main_color.green + 40),
-                     min(255, main_color.blue + 40))
-    return main_color, belly_color
+    schemes = []
+    for main_color in base_colors:
+        # Make belly color lighter
+        belly_color = rgb(min(255, main_color.red + 40),
+                          min(255, main_color.green + 40),
+                          min(255, main_color.blue + 40))
+        schemes.append((main_color, belly_color))
+    return schemes
+
+FISH_COLOR_SCHEMES = make_fish_color_schemes()
+
+def create_fish_colors(species):
+    """Color scheme of a fish species"""
+    return FISH_COLOR_SCHEMES[DEFAULT_SPECIES.color[species]]
+
+def create_fish_sprite(slot):
+    """Create a hidden fish sprite for pool slot number slot. style_fish
+    gives it its real size, direction and colors when it is used."""
+    fish_group = Group(
+        Polygon(0, 0, 1, 0, 0, 1),  # Tail
+        Oval(0, 0, 2, 1),  # Body
+        Oval(0, 0, 2, 1),  # Belly
+        Polygon(0, 0, 1, 0, 0, 1),  # Bottom fin
+        Circle(0, 0, 1, fill=None, border='orange', borderWidth=2, opacity=30),  # Gill
+        Circle(0, 0, 1, fill='white'),  # Eye
+        Circle(0, 0, 1, fill='black')  # Pupil
+    )
+    fish_group.visible = False
+    fish_group.slot = slot
+    return fish_group
+
+def style_fish(fish_group, size, x_multiplier, main_color, belly_color):
+    """Reshape and recolor a pooled fish sprite in place"""
+    tail, fish_body, fish_belly, fish_bottom_fin, fish_gill, fish_eye, fish_pupil = fish_group.children
+
+    # Tail
+    tail.pointList = [
+        [-size * x_multiplier, 0],
+        [-size * 1.6 * x_multiplier, -size * 0.5],
+        [-size * 1.6 * x_multiplier, size * 0.5]
+    ]
+    tail.fill = main_color
+
+    # Body and belly
+    fish_body.width, fish_body.height = size * 2, size
+    fish_body.centerX, fish_body.centerY = 0, 0
+    fish_body.fill = main_color
+    fish_belly.width, fish_belly.height = size * 1.6, size/2
+    fish_belly.centerX, fish_belly.centerY = 0, size/4
+    fish_belly.fill = belly_color
+
+    # Bottom fin
+    fish_bottom_fin.pointList = [
+        [size/4 * x_multiplier, size/3],
+        [size/2 * x_multiplier, 0],
+        [0, 0]
+    ]
+    fish_bottom_fin.fill = main_color
+
+    # Eye and gill
+    fish_gill.radius = size/2
+    fish_gill.centerX, fish_gill.centerY = size/3 * x_multiplier, 0
+    fish_gill.border = main_color
+    fish_eye.radius = size/10
+    fish_eye.centerX, fish_eye.centerY = size/2 * x_multiplier, -size/6
+    fish_pupil.radius = size/20
+    fish_pupil.centerX, fish_pupil.centerY = size/2 * x_multiplier, -size/6
+
+def create_fish():
+    """Take a fish sprite from the pool and send it in from the left or right
+    edge of the screen. Returns None if every pooled fish is in use."""
+    slot = app.game.fish_motion.free_slot()
+    if slot is None:
+        return None
+    fish_group = app.game.fish_pool[slot]
+
+    # Spawn fish on either side of the screen
+    side = random.choice(['left', 'right'])
+    x = -50 if side == 'left' else 450
+    y = random.randint(200, 350)
+    species = app.game.species_model.pick_species(app.game.species_population, random)
+    size_scale = app.game.species_model.random_size_scale(species, random)
+    size = 30 + (size_scale - 1) * 2.2
+
+    # Every species has its own colors
+    main_color, belly_color = create_fish_colors(species)
+
+    # Set direction and orientation
+    fish_group.direction = -1 if side == 'right' else 1
+    x_multiplier = -1 if side == 'right' else 1
+    style_fish(fish_group, size, x_multiplier, main_color, belly_color)
+
+    # Store size information
+    fish_body = fish_group.children[1]
+    fish_body.fish_size = size
+    fish_body.size_scale = size_scale
+    fish_body.species = species
+
+    # Set movement properties (kept in app.game.fish_motion)
+    speed = random.uniform(1, 2)
+    fish_group.centerX = x
+    fish_group.centerY = y
+    vertical_offset = random.uniform(0, 2*math.pi)
+    vertical_speed = random.uniform(0.02, 0.04)
+    app.game.fish_motion.activate(slot, x, y, fish_group.direction * speed,
+                                  vertical_offset, vertical_speed)
+    fish_group.visible = True
+    index_fish(fish_group)
+
+    return fish_group
+
+def index_fish(fish):
+    """Update the area around a fish where the hook can catch it"""
+    size = fish.children[1].fish_size
+    app.game.fish_index.update(fish, fish.centerX - size, fish.centerY - size,
+                               fish.centerX + size, fish.centerY + size)
+
+def index_trash(trash):
+    app.game.trash_index.update(trash, trash.left, trash.top, trash.right, trash.bottom)
+
+def release_fish(fish):
+    """Hide a fish and put it back in the pool"""
+    app.game.fish_index.remove(fish)
+    app.game.fish_motion.deactivate(fish.slot)
+    fish.visible = False
+
+def remove_trash(trash):
+    """Take a piece of trash out of the water and free its slot"""
+    app.game.trash.remove(trash)
+    app.game.trash_index.remove(trash)
+    app.game.trash_motion.deactivate(trash.slot)
+    app.game.trash_slots[trash.slot] = None
+    trash.visible = False
+
+def next_spawn_delay(spawn_chance):
+    """Number of steps until the next fish spawns.
+    Same as rolling spawn_chance once per step until it succeeds, but sampled
+    in one go (the wait follows a geometric distribution)."""
+    if spawn_chance >= 1:
+        return 1
+    return 1 + int(math.log(1 - random.random()) / math.log(1 - spawn_chance))
 
 def spawn_fish():
     """Spawn new visible fish for catching"""
@@ -247,110 +434,46 @@ def spawn_fish():
     # Adjust spawn rate based on population
     spawn_chance = max(0.2, min(1.0, app.game.fish_population / 30))
 
-    while len(app.game.visible_fish) < app.game.max_visible_fish:
-        if random.random() > spawn_chance:
-            continue
-
-        # Spawn fish on either side of the screen
-        side = random.choice(['left', 'right'])
-        x = -50 if side == 'left' else 450
-        y = random.randint(200, 350)
-        size_scale = random.randint(1, 10)
-        size = 30 + (size_scale - 1) * 2.2
-        
-        # Create fish shape
-        fish_group = Group()
-        fish_group.dragged = False
-
-        # Random fish colors
-        main_color, belly_color = create_fish_colors()
-
-        # Set direction and orientation
-        fish_group.direction = -1 if side == 'right' else 1
-        x_multiplier = -1 if side == 'right' else 1
-
-        # Create fish components
-        fish_body = Oval(0, 0, size * 2, size, fill=main_color)
-        fish_belly = Oval(0, size/4, size * 1.6, size/2, fill=belly_color)
-
-        # Tail
-        tail = Polygon(
-            -size * x_multiplier, 0,
-            -size * 1.6 * x_multiplier, -size * 0.5,
-            -size * 1.6 * x_multiplier, size * 0.5,
-            fill=main_color
-        )
-
-        # Bottom fin
-        bottom_fin_points = [
-            size/4 * x_multiplier, size/3,
-            size/2 * x_multiplier, 0,
-            0, 0,
-        ]
-        fish_bottom_fin = Polygon(*bottom_fin_points, fill=main_color)
-
-        # Eye and gill
-        fish_eye = Circle(size/2 * x_multiplier, -size/6, size/10, fill='white')
-        fish_pupil = Circle(size/2 * x_multiplier, -size/6, size/20, fill='black')
-        fish_gill = Circle(size/3 * x_multiplier, 0, size/2, fill=None, border=main_color, borderWidth=2)
-        fish_gill.opacity = 30
-
-        # Add all parts to the group
-        fish_group.add(tail)
-        fish_group.add(fish_body)
-        fish_group.add(fish_belly)
-        fish_group.add(fish_bottom_fin)
-        fish_group.add(fish_gill)
-        fish_group.add(fish_eye)
-        fish_group.add(fish_pupil)
-
-        # Store size information
-        fish_body.fish_size = size
-        fish_body.size_scale = size_scale
-
-        # Set movement properties
-        fish_group.speed = random.uniform(1, 2)
-        fish_group.centerX = x
-        fish_group.centerY = y
-        fish_group.vertical_offset = random.uniform(0, 2*math.pi)
-        fish_group.vertical_speed = random.uniform(0.02, 0.04)
-
-        app.game.visible_fish.append(fish_group)
+    # Spawn when the scheduled time comes, but never more than
+    # max_spawns_per_step fish in one step
+    spawned = 0
+    while (app.game.fish_motion.count() < app.game.max_visible_fish and
+           spawned < app.game.max_spawns_per_step and
+           app.game.time >= app.game.next_spawn_time):
+        fish = create_fish()
+        if fish is None:
+            break
+        spawned += 1
+        app.game.next_spawn_time = app.game.time + next_spawn_delay(spawn_chance)
+
+    # A full screen skips the roll this step, so a deadline that has passed
+    # is drawn again; otherwise a fish would appear the moment a slot frees
+    if (app.game.fish_motion.count() >= app.game.max_visible_fish and
+            app.game.time >= app.game.next_spawn_time):
+        app.game.next_spawn_time = app.game.time + next_spawn_delay(spawn_chance)
+
+def get_fishery_state():
+    """The parts of the game that the fishery model works on"""
+    return FisheryState(app.game.fish_population, app.game.food_level,
+                        app.game.pollution_level, app.game.day, app.game.species_population)
+
+def set_fishery_state(state):
+    app.game.fish_population = state.fish_population
+    app.game.species_population = state.species_population
+    app.game.food_level = state.food_level
+    app.game.pollution_level = state.pollution_level
+    app.game.day = state.day
 
 def calculate_reproduction():
-    """Calculate daily fish population changes"""
-    base_growth_rate = 0.15
-    carrying_capacity = 100
-
-    # Pollution reduces growth rate
-    pollution_factor = 1 - (app.game.pollution_level / 500) * 0.6
-    base_growth_rate *= max(0.4, pollution_factor)
-
-    # Calculate average size of caught fish
-    if app.game.caught_fish_sizes:
-        avg_size = sum(app.game.caught_fish_sizes) / len(app.game.caught_fish_sizes)
-        avg_size_scale = (avg_size - 30) / 2.2 + 1
-        size_penalty = max(0, (avg_size_scale - 5) * 0.04)
-
-        # Population-dependent minimum growth rate
-        min_growth_rate = max(0.05, 0.15 - (app.game.fish_population / 50) * 0.10)
-        growth_rate = max(min_growth_rate, base_growth_rate - size_penalty)
-    else:
-        growth_rate = base_growth_rate
-
-    # Calculate reproduction and mortality
-    reproduction = app.game.fish_population * growth_rate * (1 - app.game.fish_population / carrying_capacity)
-    mortality_rate = (app.game.pollution_level / 500) * 0.20
-    mortality = int(app.game.fish_population * mortality_rate)
-
-    # Apply changes
-    app.game.fish_population = max(0, int(app.game.fish_population + reproduction - mortality))
+    """Calculate daily fish population changes for every species at once"""
+    set_fishery_state(app.game.model.reproduce(get_fishery_state(), app.game.caught_fish_sizes,
+                                               app.game.caught_species))
     app.game.caught_fish_sizes = []
+    app.game.caught_species = []
 
 def update_hunger():
     """Update community food level based on caught fish"""
-    fish_deficit = max(0, app.game.food_decrease_base - app.game.caught_fish_today)
-    app.game.food_level = max(0, app.game.food_level - fish_deficit * 0.5)
+    set_fishery_state(app.game.model.feed(get_fishery_state(), app.game.caught_fish_today))
     if app.game.food_level <= 0:
         app.game.game_over = True
 
@@ -384,35 +507,35 @@ def check_game_over():
     return False
 
 def update_trash():
-    """Update trash positions and create new trash"""
+    """Create new trash and move the trash that is already floating"""
     app.game.trash_timer += 1
 
     # Create new trash
     if app.game.trash_timer >= 300:  # Every ~10 seconds
         app.game.trash_timer = 0
-        if len(app.game.trash.children) < 2:  # Max 2 pieces of trash
+        slot = app.game.trash_motion.free_slot()
+        if slot is not None:  # Max game.max_trash pieces of trash
             trash = create_trash()
             side = random.choice(['left', 'right'])
             trash.centerX = -50 if side == 'left' else 450
             trash.centerY = random.randint(200, 350)
-            trash.spawn_side = side
+            trash.slot = slot
+            app.game.trash_slots[slot] = trash
             app.game.trash.add(trash)
+            app.game.trash_motion.activate(slot, trash.centerX, trash.centerY,
+                                           1 if side == 'left' else -1,
+                                           trash.vertical_offset, 0.1, trash.rotateAngle)
+            index_trash(trash)
             app.game.pollution_level = min(500, app.game.pollution_level + 100)
 
-    # Move existing trash
-    for trash in app.game.trash.children:
-        if trash.spawn_side == 'left':
-            trash.centerX += 1
-        else:
-            trash.centerX -= 1
-
-        trash.centerY += math.sin(trash.vertical_offset + app.game.time * 0.1) * 0.5
-        trash.rotateAngle += math.sin(app.game.time * 0.05) * 0.5
+    # Move existing trash, all at once (drawn later by draw_swimmers)
+    spin = math.sin(app.game.time * 0.05) * 0.5
+    moved, gone = app.game.trash_motion.step(app.game.time, spin)
 
-        if trash.centerX < -100 or trash.centerX > 500:
-            trash.visible = False
-            app.game.trash.remove(trash)
-            app.game.pollution_level = min(500, app.game.pollution_level + 50)
+    # Trash that drifts away pollutes the water
+    for slot in gone:
+        remove_trash(app.game.trash_slots[slot])
+        app.game.pollution_level = min(500, app.game.pollution_level + 50)
 
 def update_hunger_bar():
     """Update food bar color and size"""
@@ -486,14 +609,12 @@ def try_catch_fish(mouse_x, mouse_y):
             mouse_y > bucket.centerY - app.game.bucket_height/2 and 
             mouse_y < bucket.centerY + app.game.bucket_height/2):
             app.game.caught_fish_today += 1
-            if app.game.dragged_fish in app.game.visible_fish:
-                app.game.visible_fish.remove(app.game.dragged_fish)
-            app.game.dragged_fish.visible = False
-            app.game.dragged_fish.dragged = False
-
             fish_size = app.game.dragged_fish.children[1].fish_size
+            species = app.game.dragged_fish.children[1].species
+            release_fish(app.game.dragged_fish)
             app.game.caught_fish_sizes.append(fish_size)
-            app.game.fish_population = max(0, app.game.fish_population - 1)
+            app.game.caught_species.append(species)
+            set_fishery_state(app.game.model.catch_fish(get_fishery_state(), fish_size, species))
 
             if app.game.fish_population <= 0:
                 app.game.game_over = True
@@ -505,19 +626,14 @@ def try_catch_fish(mouse_x, mouse_y):
             app.game.dragged_fish = None
             bucket.children[3].value = f'{app.game.caught_fish_today}/5'
 
-            size_scale = (fish_size - 30) / 2.2 + 1
-            food_increase = min(15, 2 + (size_scale - 1) * 1.5)
-            app.game.food_level = min(100, app.game.food_level + food_increase)
-
             if app.game.caught_fish_today >= 5:
                 end_day()
             return True
         return False
 
-    for trash in app.game.trash.children:
+    for trash in app.game.trash_index.query(mouse_x, mouse_y):
         if trash.hits(mouse_x, mouse_y):
-            app.game.trash.remove(trash)
-            trash.visible = False
+            remove_trash(trash)
 
             remaining_trash = len(app.game.trash.children)
             min_pollution = remaining_trash * 100
@@ -526,13 +642,22 @@ def try_catch_fish(mouse_x, mouse_y):
 
             return True
 
-    for fish in reversed(app.game.visible_fish[:]):
-        fish_body = fish.children[1]
-        distance = math.sqrt((fish.centerX - hook_x)**2 + (fish.centerY - hook_y)**2)
-        if distance < fish_body.fish_size and app.game.caught_fish_today < 5:
-            app.game.dragged_fish = fish
-            fish.dragged = True
-            return True
+    if app.game.caught_fish_today >= 5:
+        return False
+
+    # Fish whose catch area covers the hook; the newest one wins, as before
+    hooked = None
+    spawn_order = app.game.fish_motion.spawn_order
+    for fish in app.game.fish_index.query(hook_x, hook_y):
+        size = fish.children[1].fish_size
+        if (fish.centerX - hook_x)**2 + (fish.centerY - hook_y)**2 < size * size:
+            if hooked is None or spawn_order[fish.slot] > spawn_order[hooked.slot]:
+                hooked = fish
+    if hooked is not None:
+        app.game.dragged_fish = hooked
+        app.game.fish_motion.frozen[hooked.slot] = True
+        app.game.fish_index.remove(hooked)  # Follows the mouse until it's released
+        return True
 
     return False
 
@@ -558,30 +683,15 @@ def end_day():
     update_stats_display()
 
 def update_stats_display():
-    """Update the display of game statistics"""
-    app.game.stats.children[0].value = f'Day: {app.game.day}/{app.game.target_days}'
-    app.game.stats.children[0].left = app.game.stats.left_position
-
-    app.game.stats.children[1].value = f'Fish Population: {app.game.fish_population}'
-    app.game.stats.children[1].left = app.game.stats.left_position
-
-    app.game.stats.children[2].value = f'Food Level: {int(app.game.food_level)}%'
-    app.game.stats.children[2].left = app.game.stats.left_position
-
-    if app.game.caught_fish_sizes:
-        avg_size = sum(app.game.caught_fish_sizes) / len(app.game.caught_fish_sizes)
-        avg_size_scale = int(((avg_size - 30) / 2.2 + 1) * 10 + 0.5) / 10
-        app.game.stats.children[3].value = f'Caught Today: {app.game.caught_fish_today}/5 (Avg Size: {avg_size_scale})'
-    else:
-        app.game.stats.children[3].value = f'Caught Today: {app.game.caught_fish_today}/5'
-    app.game.stats.children[3].left = app.game.stats.left_position
-
-    if len(app.game.stats.children) < 5:
-        app.game.stats.add(Label('Pollution: 0%', app.game.stats.left_position, 100))
+    """Update the display of game statistics (see stat_labels.py)"""
+    stats = app.game.stat_labels
+    stats.update(0, (app.game.day, app.game.target_days), 'Day: {}/{}')
+    stats.update(1, (app.game.fish_population,), 'Fish Population: {}')
+    stats.update(2, (int(app.game.food_level),), 'Food Level: {}%')
+    stats.update_caught_today(3, app.game.caught_fish_today, app.game.caught_fish_sizes)
 
     pollution_percent = min(100, int(app.game.pollution_level / 5))
-    app.game.stats.children[4].value = f'Pollution: {pollution_percent}%'
-    app.game.stats.children[4].left = app.game.stats.left_position
+    stats.update(4, (pollution_percent,), 'Pollution: {}%')
 
 def create_trash():
     """Create a piece of floating trash"""
@@ -611,42 +721,132 @@ def create_trash():
 
     return trash_group
 
+def create_debug_overlay():
+    """Live shape count, frame interval and step time, toggled with the O key"""
+    overlay = Label('', 395, 8, size=10, align='right', fill='black')
+    overlay.visible = False
+    overlay.frame_time = 0  # Smoothed seconds between onStep calls
+    overlay.step_time = 0  # Smoothed seconds spent inside onStep
+    overlay.last_frame = None  # perf_counter() at the start of the last onStep
+    overlay.frames = 0
+    return overlay
+
+def count_shapes(shape):
+    """Number of shapes in a group, counting nested groups' children too"""
+    if not isinstance(shape, Group):
+        return 1
+    return 1 + sum(count_shapes(child) for child in shape.children)
+
+def update_debug_overlay(frame_start, step_seconds):
+    """frame_start is perf_counter() when this onStep began"""
+    overlay = app.debug_overlay
+    if overlay.last_frame is not None:
+        overlay.frame_time = overlay.frame_time * 0.9 + (frame_start - overlay.last_frame) * 0.1
+    overlay.last_frame = frame_start
+    overlay.step_time = overlay.step_time * 0.9 + step_seconds * 0.1
+    if not overlay.visible:
+        return
+
+    # Counting every shape isn't free, so refresh about once a second
+    overlay.frames += 1
+    if overlay.frames % 30 == 1:
+        overlay.value = (f'shapes: {count_shapes(app.group)}   frame: {overlay.frame_time * 1000:.1f} ms'
+                         f'   step: {overlay.step_time * 1000:.1f} ms')
+        overlay.toFront()
+
 def onAppStart():
     app.game = create_game()
     app.stepsPerSecond = 30
+    app.debug_overlay = create_debug_overlay()
+
+def steps_due():
+    """How many simulation steps this frame has to run to catch up with the
+    real clock. If the game falls more than max_catch_up_steps behind (a long
+    stall), the extra time is skipped instead of simulated in one burst."""
+    now = time.time()
+    if app.game.last_frame_time is None:
+        app.game.last_frame_time = now
+        return 1
+    app.game.clock_backlog += now - app.game.last_frame_time
+    app.game.last_frame_time = now
+
+    steps = int(app.game.clock_backlog / app.game.step_length)
+    if steps > app.game.max_catch_up_steps:
+        app.game.clock_backlog = 0
+        return app.game.max_catch_up_steps
+    app.game.clock_backlog -= steps * app.game.step_length
+    return steps
+
+def simulate_step():
+    """Advance the game by one fixed step. Nothing here depends on how often
+    frames are drawn."""
+    app.game.time += 1
+    spawn_fish()
+    update_trash()
+
+    # Check for game over conditions immediately
+    if app.game.food_level <= 0 or app.game.pollution_level >= 500:
+        check_game_over()
+
+    # Move every fish at once (dragged fish are frozen)
+    moved, gone = app.game.fish_motion.step(app.game.time)
+
+    # Fish that swim off screen go back to the pool
+    for slot in gone:
+        release_fish(app.game.fish_pool[slot])
+
+def draw_swimmers():
+    """Copy fish and trash positions onto their sprites and spatial indexes"""
+    motion = app.game.fish_motion
+    for slot in motion.moving_slots():
+        fish = app.game.fish_pool[slot]
+        fish.centerX = motion.x[slot]
+        fish.centerY = motion.y[slot]
+        index_fish(fish)
+
+    motion = app.game.trash_motion
+    for slot in motion.moving_slots():
+        trash = app.game.trash_slots[slot]
+        trash.rotateAngle = motion.angle[slot]
+        trash.centerX = motion.x[slot]
+        trash.centerY = motion.y[slot]
+        index_trash(trash)
+
+def render():
+    """Draw the current simulation state (once per frame)"""
+    update_fishing_rod()
+    update_hunger_bar()
+    draw_swimmers()
+
+    # Update dragged fish position
+    if app.game.dragged_fish:
+        app.game.dragged_fish.centerX = app.game.mouse_x
+        app.game.dragged_fish.centerY = app.game.mouse_y
+
+def fast_forward(steps):
+    """Run many simulation steps without drawing in between, e.g. to skip
+    ahead through a day while testing. Stops early if the game ends."""
+    for i in range(steps):
+        if app.game.game_over:
+            break
+        simulate_step()
+    render()
+    update_stats_display()
+
+    # The time spent here was simulated already, so the clock starts afresh
+    app.game.clock_backlog = 0
+    app.game.last_frame_time = None
 
 def onStep():
+    frame_start = time.perf_counter()
     if not app.game.game_over:
-        app.game.time += 1
-        spawn_fish()
-        update_fishing_rod()
-        update_trash()
-        update_hunger_bar()
-
-        # Check for game over conditions immediately
-        if app.game.food_level <= 0 or app.game.pollution_level >= 500:
-            check_game_over()
-
-        # Update fish positions
-        for fish in app.game.visible_fish[:]:  # Use slice copy to avoid modification while iterating
-            if not fish.dragged:  # Only move fish that aren't being dragged
-                # Horizontal movement
-                fish.centerX += fish.direction * fish.speed
-
-                # Vertical wavy movement
-                fish.centerY += math.sin(fish.vertical_offset + app.game.time * fish.vertical_speed) * 0.5
-
-                # Remove fish if they swim off screen
-                if (fish.centerX < -100 or fish.centerX > 500):
-                    if fish in app.game.visible_fish:
-                        app.game.visible_fish.remove(fish)
-                    fish.visible = False
-
-        # Update dragged fish position
-        if app.game.dragged_fish:
-            app.game.dragged_fish.centerX = app.game.mouse_x
-            app.game.dragged_fish.centerY = app.game.mouse_y
+        for i in range(steps_due()):
+            simulate_step()
+            if app.game.game_over:
+                break
+        render()
     update_stats_display()
+    update_debug_overlay(frame_start, time.perf_counter() - frame_start)
 
 def onMousePress(mouseX, mouseY):
     try_catch_fish(mouseX, mouseY)
@@ -656,9 +856,13 @@ def onKeyPress(key):
         end_day()
     elif key == 'r' and app.game.game_over:
         # Remove old game
-        app.game.visible = False
+        destroy_game(app.game)
         # Create new game
         app.game = create_game()
+    elif key == 'o':
+        app.debug_overlay.visible = not app.debug_overlay.visible
+    elif key == 'f' and not app.game.game_over:
+        fast_forward(app.game.fast_forward_steps)
 
 def onMouseMove(mouseX, mouseY):
     app.game.mouse_x = mouseX
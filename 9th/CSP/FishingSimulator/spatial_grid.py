@@ -0,0 +1,60 @@
+# Uniform grid spatial index for the Fishing Simulator.
+# The water is cut into square cells and every swimmer (fish or trash) is
+# listed in each cell its bounding box touches. A click then only has to look
+# at the handful of items listed in the cell under the mouse instead of every
+# item on screen, which keeps clicks fast when hundreds of fish and pieces of
+# trash are swimming at once.
+#
+# Items are kept in dicts keyed by id(), so any object can be indexed
+# (cmu_graphics shapes included) and lookups come back in the order the
+# items were added.
+
+class SpatialGrid:
+    """Square cells of cell_size pixels covering the whole plane"""
+    def __init__(self, cell_size=50):
+        self.cell_size = cell_size
+        self.cells = {}  # (col, row) -> {id(item): item}
+        self.item_cells = {}  # id(item) -> (first col, first row, last col, last row)
+
+    def cell_range(self, left, top, right, bottom):
+        size = self.cell_size
+        return (int(left // size), int(top // size), int(right // size), int(bottom // size))
+
+    def update(self, item, left, top, right, bottom):
+        """Add an item, or move it to a new bounding box.
+        Cheap when the item stays in the same cells, which is most steps."""
+        key = id(item)
+        new_range = self.cell_range(left, top, right, bottom)
+        old_range = self.item_cells.get(key)
+        if new_range == old_range:
+            return
+        if old_range is not None:
+            self.remove(item)
+
+        first_col, first_row, last_col, last_row = new_range
+        for col in range(first_col, last_col + 1):
+            for row in range(first_row, last_row + 1):
+                self.cells.setdefault((col, row), {})[key] = item
+        self.item_cells[key] = new_range
+
+    def remove(self, item):
+        """Forget an item (does nothing if it isn't indexed)"""
+        key = id(item)
+        cell_range = self.item_cells.pop(key, None)
+        if cell_range is None:
+            return
+        first_col, first_row, last_col, last_row = cell_range
+        for col in range(first_col, last_col + 1):
+            for row in range(first_row, last_row + 1):
+                cell = self.cells[(col, row)]
+                del cell[key]
+                if not cell:
+                    del self.cells[(col, row)]
+
+    def query(self, x, y):
+        """Items whose bounding box might contain the point (x, y)"""
+        cell = self.cells.get((int(x // self.cell_size), int(y // self.cell_size)))
+        return list(cell.values()) if cell else []
+
+    def __len__(self):
+        return len(self.item_cells)
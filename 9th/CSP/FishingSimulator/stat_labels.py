@@ -0,0 +1,40 @@
+# Stats labels for the Fishing Simulator that are only rewritten when the
+# numbers behind them change. Setting a Label's value re-measures its text,
+# so fs.py hands every label's numbers to StatLabels once per frame and only
+# the labels whose numbers moved are touched. Nothing here needs
+# cmu_graphics: any object with value and left attributes works as a label.
+
+def average_size_scale(caught_fish_sizes):
+    """Average caught fish size on the 1-10 scale, to one decimal place"""
+    avg_size = sum(caught_fish_sizes) / len(caught_fish_sizes)
+    return int(((avg_size - 30) / 2.2 + 1) * 10 + 0.5) / 10
+
+class StatLabels:
+    """A column of labels with the key each one is showing right now"""
+    def __init__(self, labels, left):
+        self.labels = list(labels)
+        self.left = left  # Labels are left-aligned on this x
+        self.shown = [None] * len(self.labels)
+
+    def update(self, index, values, text, key=None):
+        """Show text.format(*values) on a label, but only touch it when key
+        (the values themselves by default) differs from the one it shows"""
+        if key is None:
+            key = values
+        if self.shown[index] != key:
+            self.shown[index] = key
+            label = self.labels[index]
+            label.value = text.format(*values)
+            label.left = self.left
+
+    def update_caught_today(self, index, caught_fish_today, caught_fish_sizes):
+        """The average size only changes when a fish is caught, so the label
+        is keyed on the two counts and the average is only worked out then"""
+        key = (caught_fish_today, len(caught_fish_sizes))
+        if self.shown[index] == key:
+            return
+        if caught_fish_sizes:
+            self.update(index, (caught_fish_today, average_size_scale(caught_fish_sizes)),
+                        'Caught Today: {}/5 (Avg Size: {})', key)
+        else:
+            self.update(index, (caught_fish_today,), 'Caught Today: {}/5', key)
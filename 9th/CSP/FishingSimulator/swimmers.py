@@ -0,0 +1,69 @@
+# Parallel arrays for everything that swims in the Fishing Simulator.
+# Each fish sprite in the pool (and each piece of trash) owns a fixed slot,
+# and its position and motion are stored in NumPy arrays indexed by that slot
+# instead of on the sprite. A frame moves every swimmer with a few array
+# operations, and swimmers that leave the screen are found with one mask, so
+# the cost per frame barely grows with the number of swimmers. fs.py copies
+# the new positions onto the sprites afterwards.
+
+import numpy as np
+
+class SwimmerArrays:
+    """Position and motion of a fixed number of swimmer slots"""
+    def __init__(self, capacity, left_edge=-100, right_edge=500, bob_height=0.5):
+        self.capacity = capacity
+        self.left_edge = left_edge  # Swimmers past either edge are culled
+        self.right_edge = right_edge
+        self.bob_height = bob_height
+
+        self.x = np.zeros(capacity)
+        self.y = np.zeros(capacity)
+        self.velocity = np.zeros(capacity)  # Pixels per step, negative to the left
+        self.phase = np.zeros(capacity)  # Start of the up and down bob
+        self.bob_speed = np.zeros(capacity)
+        self.angle = np.zeros(capacity)  # Rotation in degrees
+        self.active = np.zeros(capacity, dtype=bool)  # Slot is in use
+        self.frozen = np.zeros(capacity, dtype=bool)  # In use but not moved (e.g. dragged)
+        self.spawn_order = np.zeros(capacity, dtype=np.int64)  # Higher is newer
+        self.spawned = 0  # Swimmers activated so far
+
+    def free_slot(self):
+        """First unused slot, or None if they are all taken"""
+        free = np.flatnonzero(~self.active)
+        return int(free[0]) if free.size else None
+
+    def activate(self, slot, x, y, velocity, phase, bob_speed, angle=0):
+        self.x[slot] = x
+        self.y[slot] = y
+        self.velocity[slot] = velocity
+        self.phase[slot] = phase
+        self.bob_speed[slot] = bob_speed
+        self.angle[slot] = angle
+        self.active[slot] = True
+        self.frozen[slot] = False
+        self.spawn_order[slot] = self.spawned
+        self.spawned += 1
+
+    def deactivate(self, slot):
+        self.active[slot] = False
+        self.frozen[slot] = False
+
+    def count(self):
+        return int(np.count_nonzero(self.active))
+
+    def moving_slots(self):
+        """Slots that step() moves (active and not frozen)"""
+        return np.flatnonzero(self.active & ~self.frozen)
+
+    def step(self, time, spin=0):
+        """Move every active, unfrozen swimmer one step and turn it by spin
+        degrees. Returns (slots that moved and are still on screen, slots that left)."""
+        moving = self.active & ~self.frozen
+        self.x += np.where(moving, self.velocity, 0)
+        self.y += np.where(moving, np.sin(self.phase + time * self.bob_speed) * self.bob_height, 0)
+        if spin:
+            self.angle += np.where(moving, spin, 0)
+
+        gone = moving & ((self.x < self.left_edge) | (self.x > self.right_edge))
+        self.active &= ~gone
+        return np.flatnonzero(moving & ~gone), np.flatnonzero(gone)
@@ -0,0 +1,30 @@
+from types import SimpleNamespace
+
+from stat_labels import StatLabels
+
+def make_stats():
+    labels = [SimpleNamespace(value='', left=0) for _ in range(5)]
+    return StatLabels(labels, left=15), labels
+
+def fish_size(size_scale):
+    return 30 + (size_scale - 1) * 2.2
+
+def test_caught_today_shows_average_size_after_a_catch():
+    stats, labels = make_stats()
+    stats.update_caught_today(3, 0, [])
+    assert labels[3].value == 'Caught Today: 0/5'
+
+    sizes = [fish_size(4), fish_size(6), fish_size(8)]
+    stats.update_caught_today(3, 3, sizes)
+    assert labels[3].value == 'Caught Today: 3/5 (Avg Size: 6.0)'
+    assert labels[3].left == 15
+
+def test_label_is_only_rewritten_when_its_key_changes():
+    stats, labels = make_stats()
+    stats.update_caught_today(3, 1, [fish_size(2)])
+    labels[3].value = 'untouched'
+    stats.update_caught_today(3, 1, [fish_size(2)])
+    assert labels[3].value == 'untouched'
+
+    stats.update(0, (2, 20), 'Day: {}/{}')
+    assert labels[0].value == 'Day: 2/20'
@@ -0,0 +1,229 @@
+# Offline tuning for the Food Production balance parameters.
+# The balance numbers in create_game are searched with a small CMA-ES style
+# evolution strategy instead of by hand. Every candidate set of numbers is
+# played by a few simulated player profiles (food_economy.py plays a whole
+# game in well under a millisecond) and scored on how close each profile's
+# win rate is to its target, plus how many games are lost in the first few
+# days, so the game gets harder the worse you play without being unfair early.
+# Candidates in a generation are played in parallel on a process pool, all
+# with the same random games so they are compared fairly.
+#
+# A game is about a hundred events long, so the luck evens out and each
+# profile's win rate is nearly all or nothing. A novice that wins only some
+# of the time (the 30% target) sits in a narrow strip: little pollution per
+# item, cheap waste and strong sorting, so the ranges below reach down to 0
+# and the parameters are searched to a tenth instead of in whole steps.
+# The search can still settle where the novice never wins while the other
+# two are on target, so main() names every profile that misses its target
+# by more than TARGET_TOLERANCE; try another --seed when that happens.
+#
+#   python balance_optimizer.py --generations 40 --games 300 --workers 4
+
+import argparse
+import math
+import random
+from collections import namedtuple
+from multiprocessing import Pool
+
+import numpy as np
+
+from food_economy import FoodEconomy, new_state, PROCESS_BONUS, PROCESS_FOOD, \
+    SORT_CORRECT, SORT_INCORRECT
+
+# Balance parameters in create_game, with the range searched for each
+PARAMETERS = [
+    # name                                 low  high  current
+    ('food_production_pollution',          0,   40,   20),
+    ('food_production_waste',              0,   30,   15),
+    ('waste_pollution_factor',             0,   10,   2),
+    ('correct_sort_reduction',             5,   60,   25),
+    ('correct_sort_pollution_reduction',   0,   30,   15),
+    ('incorrect_sort_waste_increase',      0,   40,   20),
+    ('incorrect_sort_pollution_increase',  0,   30,   10),
+    ('daily_food_decrease',                10,  50,   25),
+]
+LOWS = np.array([low for _, low, _, _ in PARAMETERS], dtype=np.float64)
+HIGHS = np.array([high for _, _, high, _ in PARAMETERS], dtype=np.float64)
+CURRENT = np.array([current for _, _, _, current in PARAMETERS], dtype=np.float64)
+
+PlayerProfile = namedtuple('PlayerProfile', ['name', 'bonus_chance', 'accuracy',
+                                             'sort_rate', 'target_win_rate'])
+
+# Simulated players. bonus_chance is how often they grab bonus food, accuracy
+# how often they sort waste into the right monitor and sort_rate how much of
+# the waste they get round to sorting at all.
+PROFILES = [
+    PlayerProfile('novice', 0.10, 0.60, 0.70, 0.30),
+    PlayerProfile('casual', 0.10, 0.80, 0.90, 0.60),
+    PlayerProfile('expert', 0.20, 0.95, 1.00, 0.90),
+]
+
+FOOD_PER_DAY = 5  # food_collection_target: the day ends after five items
+EARLY_DAYS = 5  # Losing before this day counts against the difficulty curve
+EARLY_LOSS_WEIGHT = 2
+FINALISTS = 8  # Best candidates played again on fresh games at the end
+TARGET_TOLERANCE = 0.10  # Win rates further than this from their target are reported
+
+def to_parameters(x):
+    """Search point (0-1 for every parameter) to parameters, to a tenth"""
+    values = LOWS + np.clip(x, 0, 1) * (HIGHS - LOWS)
+    return {name: round(float(value), 1) for (name, _, _, _), value in zip(PARAMETERS, values)}
+
+def play_day(profile, rng):
+    """Events for one day of this player"""
+    events = []
+    for _ in range(FOOD_PER_DAY):
+        events.append(PROCESS_BONUS if rng.random() < profile.bonus_chance else PROCESS_FOOD)
+        if rng.random() < profile.sort_rate:
+            events.append(SORT_CORRECT if rng.random() < profile.accuracy else SORT_INCORRECT)
+    return events
+
+def play_games(economy, profile, games, seed):
+    """(win rate, early loss rate) of a profile over some games"""
+    wins = early_losses = 0
+    for game in range(games):
+        rng = random.Random(seed * 1000003 + game)
+        days = [play_day(profile, rng) for _ in range(economy.target_days)]
+        state, result = economy.run(new_state(), days, rng)
+        if result == 'won':
+            wins += 1
+        elif state.day < EARLY_DAYS:
+            early_losses += 1
+    return wins / games, early_losses / games
+
+def evaluate(job):
+    """Loss of one candidate (lower is better), with its win rates"""
+    x, games, seed = job
+    economy = FoodEconomy(**to_parameters(x))
+    loss = 0
+    win_rates = []
+    for index, profile in enumerate(PROFILES):
+        win_rate, early_loss_rate = play_games(economy, profile, games, seed + index)
+        loss += (win_rate - profile.target_win_rate) ** 2 + EARLY_LOSS_WEIGHT * early_loss_rate ** 2
+        win_rates.append(win_rate)
+    return loss, win_rates
+
+class EvolutionStrategy:
+    """(mu/mu_w, lambda) evolution strategy with cumulative step-size
+    adaptation and a diagonal covariance (separable CMA-ES), searching the
+    unit cube. ask() gives a generation of points and tell() learns from
+    their losses."""
+    def __init__(self, mean, sigma=0.2, population=12, rng=None):
+        self.mean = np.asarray(mean, dtype=np.float64)
+        self.sigma = sigma
+        self.population = population
+        self.rng = rng or np.random.default_rng()
+        n = len(self.mean)
+
+        # Recombination weights for the best half of each generation
+        self.mu = population // 2
+        weights = np.log(self.mu + 0.5) - np.log(np.arange(1, self.mu + 1))
+        self.weights = weights / weights.sum()
+        self.mu_eff = 1 / np.sum(self.weights ** 2)
+
+        # Learning rates, as in the usual CMA-ES defaults (the covariance
+        # rates are scaled up because only the diagonal is learned)
+        self.c_sigma = (self.mu_eff + 2) / (n + self.mu_eff + 5)
+        self.d_sigma = 1 + 2 * max(0, math.sqrt((self.mu_eff - 1) / (n + 1)) - 1) + self.c_sigma
+        self.c_c = (4 + self.mu_eff / n) / (n + 4 + 2 * self.mu_eff / n)
+        self.c_1 = 2 / ((n + 1.3) ** 2 + self.mu_eff) * (n + 2) / 3
+        self.c_mu = min(1 - self.c_1, 2 * (self.mu_eff - 2 + 1 / self.mu_eff) /
+                        ((n + 2) ** 2 + self.mu_eff) * (n + 2) / 3)
+        self.chi_n = math.sqrt(n) * (1 - 1 / (4 * n) + 1 / (21 * n * n))
+
+        self.variances = np.ones(n)  # Diagonal of the covariance matrix
+        self.path_sigma = np.zeros(n)
+        self.path_c = np.zeros(n)
+        self.generation = 0
+
+    def ask(self):
+        """A generation of points to try"""
+        self.steps = self.rng.standard_normal((self.population, len(self.mean)))
+        return self.mean + self.sigma * self.steps * np.sqrt(self.variances)
+
+    def tell(self, losses):
+        """Move towards the best points of the last ask()"""
+        self.generation += 1
+        best = np.argsort(losses)[:self.mu]
+        steps = self.steps[best]  # In the unscaled, unit-variance space
+        step = self.weights @ steps
+        scaled_step = step * np.sqrt(self.variances)
+        self.mean = self.mean + self.sigma * scaled_step
+
+        # Step size grows when steps keep pointing the same way, shrinks when they cancel
+        self.path_sigma = ((1 - self.c_sigma) * self.path_sigma +
+                           math.sqrt(self.c_sigma * (2 - self.c_sigma) * self.mu_eff) * step)
+        norm = np.linalg.norm(self.path_sigma)
+        self.sigma *= math.exp((self.c_sigma / self.d_sigma) * (norm / self.chi_n - 1))
+
+        # Stretch the search along parameters whose good values keep moving
+        stalled = norm / math.sqrt(1 - (1 - self.c_sigma) ** (2 * self.generation)) >= 1.4 * self.chi_n
+        self.path_c = ((1 - self.c_c) * self.path_c +
+                       (0 if stalled else math.sqrt(self.c_c * (2 - self.c_c) * self.mu_eff)) * scaled_step)
+        rank_mu = self.weights @ (steps ** 2 * self.variances)
+        self.variances = ((1 - self.c_1 - self.c_mu) * self.variances +
+                          self.c_1 * self.path_c ** 2 + self.c_mu * rank_mu)
+
+def optimize(generations=40, population=12, games=300, workers=None, seed=0, report=print):
+    """Search the balance parameters, starting from the current ones.
+    Returns (best parameters, their loss, their win rates)."""
+    start = (CURRENT - LOWS) / (HIGHS - LOWS)
+    strategy = EvolutionStrategy(start, population=population, rng=np.random.default_rng(seed))
+    finalists = []  # (loss, point) of the best candidates so far
+
+    with Pool(workers) as pool:
+        for generation in range(generations):
+            asked = strategy.ask()
+            points = np.clip(asked, 0, 1)
+            # Every candidate plays the same games; new games every generation
+            game_seed = seed * 10007 + generation * len(PROFILES)
+            results = pool.map(evaluate, [(x, games, game_seed) for x in points])
+            # Points outside the search range are played at its edge, and pay
+            # for how far out they are so the mean doesn't wander off
+            outside = np.sum((asked - points) ** 2, axis=1)
+            losses = [loss + penalty for (loss, _), penalty in zip(results, outside)]
+            strategy.tell(losses)
+            finalists = sorted(finalists + list(zip(losses, points)), key=lambda item: item[0])[:FINALISTS]
+
+            report(f'generation {generation + 1}: best loss {min(losses):.4f}, '
+                   f'median {np.median(losses):.4f}, sigma {strategy.sigma:.3f}')
+
+        # The best candidate is partly the one that got the luckiest games,
+        # so play the finalists and the mean of the search again on more,
+        # fresh games and keep whichever really does best
+        candidates = [point for _, point in finalists] + [np.clip(strategy.mean, 0, 1)]
+        game_seed = seed * 10007 + generations * len(PROFILES)
+        results = pool.map(evaluate, [(x, games * 4, game_seed) for x in candidates])
+
+    index = min(range(len(results)), key=lambda i: results[i][0])
+    best_loss, best_win_rates = results[index]
+    return to_parameters(candidates[index]), best_loss, best_win_rates
+
+def main():
+    parser = argparse.ArgumentParser(description='Tune the Food Production balance parameters.')
+    parser.add_argument('--generations', type=int, default=40)
+    parser.add_argument('--population', type=int, default=12, help='candidates per generation')
+    parser.add_argument('--games', type=int, default=300, help='games per profile per candidate')
+    parser.add_argument('--workers', type=int, default=None, help='processes (default: one per CPU)')
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    current_loss, current_win_rates = evaluate(((CURRENT - LOWS) / (HIGHS - LOWS), args.games * 4, 1))
+    print(f'current parameters: loss {current_loss:.4f}, win rates ' +
+          ', '.join(f'{profile.name} {rate:.0%}' for profile, rate in zip(PROFILES, current_win_rates)))
+
+    parameters, loss, win_rates = optimize(args.generations, args.population, args.games,
+                                           args.workers, args.seed)
+    print(f'\nbest parameters: loss {loss:.4f}, win rates ' +
+          ', '.join(f'{profile.name} {rate:.0%} (target {profile.target_win_rate:.0%})'
+                    for profile, rate in zip(PROFILES, win_rates)))
+    # A small total loss can still hide one profile that is far off
+    for profile, rate in zip(PROFILES, win_rates):
+        if abs(rate - profile.target_win_rate) > TARGET_TOLERANCE:
+            print(f'  {profile.name} missed its target by {abs(rate - profile.target_win_rate):.0%}')
+    print('\n    game.economy = FoodEconomy(' +
+          ',\n                               '.join(f'{name}={value}' for name, value in parameters.items()) +
+          ',\n                               target_days=game.target_days)')
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,181 @@
+# Headless food, waste and pollution economy for the Food Production game.
+# The numbers the player is juggling are kept in a small immutable FoodState,
+# and FoodEconomy turns one state into the next for every event in the game:
+# processing food (normal or bonus), sorting waste right or wrong, food falling
+# off the conveyor and the end of a day. fp.py sends every event through here
+# and draws the labels and meters from the result, so the rules live in one
+# place and a whole 20-day game can be played without opening a window:
+#
+#   python food_economy.py --food 5 --bonus 0.1 --accuracy 0.8 --games 1000
+
+import argparse
+import random
+from collections import namedtuple
+
+FoodState = namedtuple('FoodState', ['food_level', 'food_waste', 'pollution_level',
+                                     'food_production', 'produced_today', 'day'])
+
+# Events the game sends to FoodEconomy.apply
+PROCESS_FOOD = 'process_food'
+PROCESS_BONUS = 'process_bonus'
+SORT_CORRECT = 'sort_correct'
+SORT_INCORRECT = 'sort_incorrect'
+CONVEYOR_EXPIRE = 'conveyor_expire'
+END_DAY = 'end_day'
+
+def new_state(food_level=75, food_waste=0, pollution_level=0, food_production=0,
+              produced_today=0, day=1):
+    """Starting state of a game (the same numbers create_game uses)"""
+    return FoodState(food_level, food_waste, pollution_level, food_production, produced_today, day)
+
+class FoodEconomy:
+    """Rules for how food, waste and pollution change with each event"""
+    def __init__(self, food_production_pollution=20, food_production_waste=15,
+                 waste_pollution_factor=2, correct_sort_reduction=25,
+                 correct_sort_pollution_reduction=15, incorrect_sort_waste_increase=20,
+                 incorrect_sort_pollution_increase=10, daily_food_decrease=25,
+                 max_food=100, max_waste=100, max_pollution=500, max_production=100,
+                 target_days=20):
+        self.food_production_pollution = food_production_pollution
+        self.food_production_waste = food_production_waste
+        self.waste_pollution_factor = waste_pollution_factor  # Pollution per 100% waste, each item
+        self.correct_sort_reduction = correct_sort_reduction
+        self.correct_sort_pollution_reduction = correct_sort_pollution_reduction
+        self.incorrect_sort_waste_increase = incorrect_sort_waste_increase
+        self.incorrect_sort_pollution_increase = incorrect_sort_pollution_increase
+        self.daily_food_decrease = daily_food_decrease
+        self.max_food = max_food
+        self.max_waste = max_waste
+        self.max_pollution = max_pollution
+        self.max_production = max_production
+        self.target_days = target_days
+
+    def food_increase(self, is_bonus, rng=random):
+        """How much food one processed item gives the community"""
+        if is_bonus:
+            return min(25, 15 + rng.randint(0, 10))
+        return min(15, 5 + rng.randint(0, 5))
+
+    def process_food(self, state, is_bonus=False, rng=random):
+        """A food item is dropped in the collection area. Bonus food feeds
+        more people but makes twice the waste and pollution."""
+        food = min(self.max_food, state.food_level + self.food_increase(is_bonus, rng))
+        multiplier = 2 if is_bonus else 1
+        waste = min(self.max_waste, state.food_waste + self.food_production_waste * multiplier)
+        state = state._replace(food_level=food, food_waste=waste,
+                               food_production=state.food_production + 1,
+                               produced_today=state.produced_today + 1)
+        if waste >= self.max_waste:
+            # The facility is overwhelmed and the game ends before any pollution
+            return state
+
+        pollution = (self.food_production_pollution * multiplier +
+                     waste * self.waste_pollution_factor / 100)
+        return state._replace(pollution_level=min(self.max_pollution, state.pollution_level + pollution))
+
+    def sort_waste(self, state, correct):
+        """A piece of waste is put in the compost or the trash"""
+        if correct:
+            return state._replace(
+                food_waste=max(0, state.food_waste - self.correct_sort_reduction),
+                pollution_level=max(0, state.pollution_level - self.correct_sort_pollution_reduction))
+        return state._replace(
+            food_waste=min(self.max_waste, state.food_waste + self.incorrect_sort_waste_increase),
+            pollution_level=min(self.max_pollution,
+                                state.pollution_level + self.incorrect_sort_pollution_increase))
+
+    def expire_food(self, state):
+        """A food item reached the end of the conveyor without being picked up"""
+        return state._replace(food_production=min(self.max_production, state.food_production + 1))
+
+    def end_day(self, state):
+        """The community eats and a new day starts. Game over checks are left
+        to the caller, as end_day in the game checks them first."""
+        return state._replace(food_level=max(0, state.food_level - self.daily_food_decrease),
+                              produced_today=0, day=state.day + 1)
+
+    def apply(self, state, event, rng=random):
+        """The state after one event (one of the event names above)"""
+        if event == PROCESS_FOOD:
+            return self.process_food(state, False, rng)
+        if event == PROCESS_BONUS:
+            return self.process_food(state, True, rng)
+        if event == SORT_CORRECT:
+            return self.sort_waste(state, True)
+        if event == SORT_INCORRECT:
+            return self.sort_waste(state, False)
+        if event == CONVEYOR_EXPIRE:
+            return self.expire_food(state)
+        if event == END_DAY:
+            return self.end_day(state)
+        raise ValueError(f'unknown event: {event}')
+
+    def outcome(self, state):
+        """'starved', 'polluted', 'wasted', 'won' or None while the game goes
+        on, checked in the same order as check_game_over"""
+        if state.food_level <= 0:
+            return 'starved'
+        if state.pollution_level >= self.max_pollution:
+            return 'polluted'
+        if state.food_waste >= self.max_waste:
+            return 'wasted'
+        if state.day >= self.target_days:
+            return 'won'
+        return None
+
+    def run(self, state, days, rng=random):
+        """Play days in a row, each a list of events, with the same checks as
+        the game. Every day ends with end_day. Returns (final state, outcome),
+        where the outcome is None if the days ran out before the game ended."""
+        for events in days:
+            for event in events:
+                state = self.apply(state, event, rng)
+                # Processing food that fills the waste ends the game straight away
+                if event in (PROCESS_FOOD, PROCESS_BONUS) and state.food_waste >= self.max_waste:
+                    return state, 'wasted'
+                # onStep only watches food and pollution between days
+                if state.food_level <= 0 or state.pollution_level >= self.max_pollution:
+                    return state, self.outcome(state)
+
+            if self.outcome(state):
+                return state, self.outcome(state)
+            state = self.end_day(state)
+            if state.food_level <= 0 or state.pollution_level >= self.max_pollution:
+                return state, self.outcome(state)
+        return state, None
+
+def player_day(food_per_day, bonus_chance, accuracy, rng=random):
+    """Events for one day of a simple player: every item they process makes a
+    piece of waste, which they sort right with the given accuracy"""
+    events = []
+    for _ in range(food_per_day):
+        events.append(PROCESS_BONUS if rng.random() < bonus_chance else PROCESS_FOOD)
+        events.append(SORT_CORRECT if rng.random() < accuracy else SORT_INCORRECT)
+    return events
+
+def main():
+    parser = argparse.ArgumentParser(description='Simulate the Food Production economy.')
+    parser.add_argument('--food', type=int, default=5, help='food items processed every day')
+    parser.add_argument('--bonus', type=float, default=0.1, help='chance an item is bonus food')
+    parser.add_argument('--accuracy', type=float, default=0.8, help='chance waste is sorted right')
+    parser.add_argument('--games', type=int, default=1)
+    parser.add_argument('--seed', type=int, default=None)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    economy = FoodEconomy()
+    outcomes = {}
+    for _ in range(args.games):
+        days = [player_day(args.food, args.bonus, args.accuracy, rng) for _ in range(economy.target_days)]
+        state, result = economy.run(new_state(), days, rng)
+        outcomes[result] = outcomes.get(result, 0) + 1
+
+    if args.games == 1:
+        print(f'day {state.day}: food {state.food_level}%, waste {state.food_waste}%, '
+              f'pollution {state.pollution_level / 5:.0f}%, outcome: {result or "still playing"}')
+    else:
+        for result, count in sorted(outcomes.items(), key=lambda item: -item[1]):
+            print(f'{result or "still playing"}: {count / args.games:.1%}')
+
+if __name__ == '__main__':
+    main()
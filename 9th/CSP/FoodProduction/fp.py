@@ -13,12 +13,14 @@ import random
 import math
 import time
 
+from food_economy import FoodEconomy, FoodState, PROCESS_BONUS, PROCESS_FOOD, \
+    SORT_CORRECT, SORT_INCORRECT, CONVEYOR_EXPIRE
+
 def create_game():
     game = Group()
 
     # Initial game parameters
     game.food_production = 0
-    game.food_decrease_base = 15
     game.food_level = 75
     game.food_waste = 0
     game.day = 1
@@ -26,17 +28,17 @@ def create_game():
     game.game_over = False
     game.time = 0
     game.produced_food_today = 0
-    game.produced_food_types = []
-
-    # Balance parameters
-    game.food_production_pollution = 20
-    game.food_production_waste = 15
-    game.waste_pollution_factor = 2
-    game.correct_sort_reduction = 25
-    game.correct_sort_pollution_reduction = 15
-    game.incorrect_sort_waste_increase = 20
-    game.incorrect_sort_pollution_increase = 10
-    game.daily_food_decrease = 25
+
+    # Balance parameters (the rules themselves are in food_economy.py)
+    game.economy = FoodEconomy(food_production_pollution=20,
+                               food_production_waste=15,
+                               waste_pollution_factor=2,
+                               correct_sort_reduction=25,
+                               correct_sort_pollution_reduction=15,
+                               incorrect_sort_waste_increase=20,
+                               incorrect_sort_pollution_increase=10,
+                               daily_food_decrease=25,
+                               target_days=game.target_days)
 
     # Mouse position tracking
     game.mouse_x = 200
@@ -53,14 +55,35 @@ def create_game():
     game.conveyor_y = 200
     game.conveyor_width = 450
     game.conveyor_height = 40
-    game.conveyor_items = []
     game.conveyor_timer = 0
     game.conveyor_spacing = 70
     game.conveyor_speed = 1.5
+    game.conveyor_max_items = 5
+
+    # The conveyor is a ring buffer of slots, oldest item at conveyor_head.
+    # Items keep their slot until they leave the belt; picking one up leaves
+    # a hole (None) that the head skips over. There are twice as many slots
+    # as items so holes never stop new items from spawning.
+    game.conveyor_capacity = 2 * game.conveyor_max_items
+    game.conveyor_slots = [None] * game.conveyor_capacity
+    game.conveyor_head = 0  # Slot of the oldest item
+    game.conveyor_used = 0  # Slots from the head up to the newest item, holes included
+    game.conveyor_count = 0  # Items actually on the belt
+
+    # How far the belt has moved since the game started. An item's x position
+    # is its start position plus how far the belt moved since it spawned.
+    game.belt_offset = 0
+    game.last_spawn_offset = None
+    game.conveyor_start_x = game.conveyor_x - game.conveyor_width/2 + 20
+    game.conveyor_end_x = game.conveyor_x + game.conveyor_width/2
+    game.conveyor_min_gap = game.conveyor_spacing - 20  # Belt movement between spawns
+    game.conveyor_lookup = {}  # spawn_offset // conveyor_min_gap -> slot, for clicks
+    game.food_pool = create_food_pool()  # Hidden food sprites, by food type
 
     # Waste and pollution visualization
     game.waste = Group()
     game.waste_timer = 0
+    game.waste_pool = create_waste_pool()  # Hidden waste sprites, by waste type
     game.pollution_level = 0
 
     # Feedback system
@@ -197,6 +220,10 @@ def create_game():
     game.conveyor_belt.add(belt_details)
     game.conveyor_belt.add(rollers)
 
+    # Every item on the belt sits in this group, so the whole belt's worth of
+    # food moves with one write per step
+    game.conveyor_food = Group()
+
     # Create mouse cursor indicator
     game.cursor_indicator = Group()
 
@@ -465,146 +492,212 @@ def create_game():
         Label('', 200, 240, fill='white'),
         Label('Press R to restart', 200, 280, fill='white')
     )
+    # Food on the belt draws over everything built after the belt (like the
+    # collection area just above it), but under the game over screen
+    game.conveyor_food.toFront()
+
     game.game_over_screen.visible = False
     game.game_over_screen.toFront()
 
     return game
 
-def create_food_item():
-    """Create a food item for the conveyor belt"""
-    food_group = Group()
-    food_type = random.choice(['bread', 'apple', 'carrot', 'tomato', 'potato', 'corn', 'mushroom', 'wheat'])
+FOOD_TYPES = ['bread', 'apple', 'carrot', 'tomato', 'potato', 'corn', 'mushroom', 'wheat']
+
+# Food colors, made once instead of with a new rgb() for every item
+BREAD_COLOR = rgb(210, 180, 140)
+BREAD_DETAIL_COLOR = rgb(180, 150, 110)
+STEM_COLOR = rgb(101, 67, 33)
+CARROT_COLOR = rgb(255, 140, 0)
+CORN_COLOR = rgb(255, 215, 0)
+KERNEL_COLOR = rgb(255, 200, 0)
+
+# ---------------------------------------
+# FOOD SPRITES
+# Each builder returns the shapes for one food type, drawn around (0, 0).
+# Food sprites are pooled by type: items that are processed or fall off the
+# conveyor go back to app.game.food_pool and are reused for the next item.
+# ---------------------------------------
+def build_bread_food():
+    # Bread loaf
+    shapes = [Oval(0, 0, 20, 10, fill=BREAD_COLOR)]
+
+    # Bread details
+    for i in range(3):
+        shapes.append(Line(-8 + i*8, -3, -8 + i*8, 3, fill=BREAD_DETAIL_COLOR, lineWidth=1))
+    return shapes
+
+def build_apple_food():
+    apple = Circle(0, 0, 8, fill='red')  # Apple body
+    stem = Line(0, -8, 0, -12, fill=STEM_COLOR, lineWidth=2)  # Apple stem
+    leaf = Oval(2, -12, 6, 3, fill='green')  # Apple leaf
+    return [apple, stem, leaf]
+
+def build_carrot_food():
+    # Carrot body
+    carrot = Polygon(-5, 0, 5, 0, 3, 15, -3, 15, fill=CARROT_COLOR)
+
+    # Carrot top
+    top = Polygon(-5, 0, 5, 0, 3, -8, -3, -8, fill='green')
+    return [carrot, top]
+
+def build_tomato_food():
+    # Tomato body
+    tomato = Circle(0, 0, 8, fill='red')
+
+    # Tomato leaves
+    leaf1 = Line(0, -5, -5, -9, fill='green')
+    leaf2 = Line(0, -5, 0, -11, fill='green')
+    leaf3 = Line(0, -5, 5, -9, fill='green')
+    return [tomato, leaf1, leaf2, leaf3]
+
+def build_potato_food():
+    # Potato body - improved design without prominent eyes
+    shapes = [Oval(0, 0, 15, 10, fill=BREAD_COLOR)]
+
+    # Potato texture - subtle bumps instead of eyes
+    for i in range(3):
+        shapes.append(Circle(-5 + i*5, 0, 1, fill=BREAD_DETAIL_COLOR))
+    return shapes
+
+def build_corn_food():
+    # Corn cob
+    shapes = [Oval(0, 0, 15, 8, fill=CORN_COLOR)]
+
+    # Corn kernels
+    for i in range(3):
+        shapes.append(Circle(-5 + i*5, 0, 2, fill=KERNEL_COLOR))
+    return shapes
+
+def build_mushroom_food():
+    # Mushroom cap and stem body
+    shapes = [Oval(0, 0, 15, 10, fill=BREAD_COLOR)]
+
+    # Covering for stem
+    for i in range(2):
+        shapes.append(Circle(-5 + i*10, 3, 2, fill='black'))
+    return shapes
+
+def build_wheat_food():
+    # Wheat bundle
+    bundle = Group()
+
+    # Wheat stem
+    stem = Line(0, -9, 0, 20, fill='beige')
+    bundle.add(stem)
+
+    # Wheat stalks
+    for i in range(5):
+        stalk = Line(-5, -5 + i*4, 5, -5 + i*4, fill=BREAD_COLOR)
+        bundle.add(stalk)
+    return [bundle]
+
+FOOD_BUILDERS = {
+    'bread': build_bread_food,
+    'apple': build_apple_food,
+    'carrot': build_carrot_food,
+    'tomato': build_tomato_food,
+    'potato': build_potato_food,
+    'corn': build_corn_food,
+    'mushroom': build_mushroom_food,
+    'wheat': build_wheat_food,
+}
+
+def build_food(food_type):
+    """Build a new, hidden food sprite. Every sprite carries the bonus
+    decoration, which create_food_item shows or hides."""
+    food_group = Group(*FOOD_BUILDERS[food_type]())
     food_group.food_type = food_type
 
+    # Golden glow and star for bonus food items
+    food_group.glow = Circle(0, 0, 15, fill=None, border='gold', borderWidth=2)
+    food_group.star = Label('★', 0, 0, size=12, fill='gold', bold=True)
+    food_group.add(food_group.glow)
+    food_group.add(food_group.star)
+
+    food_group.visible = False
+    return food_group
+
+def create_food_pool():
+    """One prebuilt sprite for every food type"""
+    return {food_type: [build_food(food_type)] for food_type in FOOD_TYPES}
+
+def create_food_item():
+    """Take a food sprite from the pool and put it at the start of the conveyor belt"""
+    food_type = random.choice(FOOD_TYPES)
+
     # Set position at the start of the conveyor belt
-    x = app.game.conveyor_x - app.game.conveyor_width/2 + 20
+    x = app.game.conveyor_start_x
     y = app.game.conveyor_y - 10
 
     # Randomly decide if this is a bonus food item (10% chance)
     is_bonus = random.random() < 0.1
-    food_group.is_bonus = is_bonus
 
-    if food_type == 'bread':
-        # Bread loaf
-        bread = Oval(x, y, 20, 10, fill=rgb(210, 180, 140))
-        food_group.add(bread)
-
-        # Bread details
-        for i in range(3):
-            detail = Line(x - 8 + i*8, y - 3, x - 8 + i*8, y + 3, 
-                         fill=rgb(180, 150, 110), lineWidth=1)
-            food_group.add(detail)
-
-    elif food_type == 'apple':
-        # Apple body
-        apple = Circle(x, y, 8, fill='red')
-        food_group.add(apple)
-
-        # Apple stem
-        stem = Line(x, y - 8, x, y - 12, fill=rgb(101, 67, 33), lineWidth=2)
-        food_group.add(stem)
-
-        # Apple leaf
-        leaf = Oval(x + 2, y - 12, 6, 3, fill='green')
-        food_group.add(leaf)
-
-    elif food_type == 'carrot':
-        # Carrot body
-        carrot = Polygon(
-            x - 5, y,
-            x + 5, y,
-            x + 3, y + 15,
-            x - 3, y + 15,
-            fill=rgb(255, 140, 0)
-        )
-        food_group.add(carrot)
-
-        # Carrot top
-        top = Polygon(
-            x - 5, y,
-            x + 5, y,
-            x + 3, y - 8,
-            x - 3, y - 8,
-            fill='green'
-        )
-        food_group.add(top)
-
-    elif food_type == 'tomato':
-        # Tomato body
-        tomato = Circle(x, y, 8, fill='red')
-        food_group.add(tomato)
-
-        # Tomato leaves
-        leaf1 = Line(x, y - 5, x - 5, y - 9, fill='green')
-        leaf2 = Line(x, y - 5, x, y - 11, fill='green')
-        leaf3 = Line(x, y - 5, x + 5, y - 9, fill='green')
-        food_group.add(leaf1)
-        food_group.add(leaf2)
-        food_group.add(leaf3)
-
-    elif food_type == 'potato':
-        # Potato body - improved design without prominent eyes
-        potato = Oval(x, y, 15, 10, fill=rgb(210, 180, 140))
-        food_group.add(potato)
-
-        # Potato texture - subtle bumps instead of eyes
-        for i in range(3):
-            bump = Circle(x - 5 + i*5, y, 1, fill=rgb(180, 150, 110))
-            food_group.add(bump)
-
-    elif food_type == 'corn':
-        # Corn cob
-        cob = Oval(x, y, 15, 8, fill=rgb(255, 215, 0))
-        food_group.add(cob)
-
-        # Corn kernels
-        for i in range(3):
-            kernel = Circle(x - 5 + i*5, y, 2, fill=rgb(255, 200, 0))
-            food_group.add(kernel)
-
-    elif food_type == 'mushroom':
-        # Mushroom cap and stem body
-        potato = Oval(x, y, 15, 10, fill=rgb(210, 180, 140))
-        food_group.add(potato)
-
-        # Covering for stem
-        for i in range(2):
-            eye = Circle(x - 5 + i*10, y + 3, 2, fill='black')
-            food_group.add(eye)
-
-    else:  # wheat
-        # Wheat bundle
-        bundle = Group()
-
-        # Wheat stem
-        stem = Line(x, y - 9, x, y + 20, fill='beige')
-        bundle.add(stem)
-
-        # Wheat stalks
-        for i in range(5):
-            stalk = Line(x - 5, y - 5 + i*4, x + 5, y - 5 + i*4, 
-                        fill=rgb(210, 180, 140))
-            bundle.add(stalk)
-
-        food_group.add(bundle)
-
-    # Add bonus indicator if this is a bonus food item
-    if is_bonus:
-        # Add a golden glow effect
-        glow = Circle(x, y, 15, fill=None, border='gold', borderWidth=2)
-        food_group.add(glow)
-        # Add a star symbol
-        star = Label('★', x, y, size=12, fill='gold', bold=True)
-        food_group.add(star)
+    pool = app.game.food_pool[food_type]
+    food_group = pool.pop() if pool else build_food(food_type)
+    food_group.is_bonus = is_bonus
+    food_group.glow.visible = is_bonus
+    food_group.star.visible = is_bonus
 
     # Set fixed movement properties
     food_group.speed = app.game.conveyor_speed
     food_group.centerX = x
     food_group.centerY = y
     food_group.selected = False
+    food_group.visible = True
 
     return food_group
 
+def release_food(food):
+    """Hide a food item and put it back in the pool"""
+    food.visible = False
+    app.game.food_pool[food.food_type].append(food)
+
+def food_x(food):
+    """Where an item on the belt is, worked out from the belt offset"""
+    return app.game.conveyor_start_x + app.game.belt_offset - food.spawn_offset
+
+def add_to_conveyor(food):
+    """Put a new item in the next free slot at the start of the belt"""
+    slot = (app.game.conveyor_head + app.game.conveyor_used) % app.game.conveyor_capacity
+    app.game.conveyor_slots[slot] = food
+    app.game.conveyor_used += 1
+    app.game.conveyor_count += 1
+
+    food.slot = slot
+    food.spawn_offset = app.game.belt_offset
+    app.game.last_spawn_offset = app.game.belt_offset
+    app.game.conveyor_lookup[int(food.spawn_offset // app.game.conveyor_min_gap)] = slot
+    app.game.conveyor_food.add(food)
+
+def take_from_conveyor(food):
+    """Lift an item off the belt, leaving a hole in its slot"""
+    app.game.conveyor_slots[food.slot] = None
+    app.game.conveyor_count -= 1
+    del app.game.conveyor_lookup[int(food.spawn_offset // app.game.conveyor_min_gap)]
+    app.game.conveyor_food.remove(food)
+
+def advance_conveyor_head():
+    app.game.conveyor_head = (app.game.conveyor_head + 1) % app.game.conveyor_capacity
+    app.game.conveyor_used -= 1
+
+def food_at(mouse_x, mouse_y):
+    """The item on the belt within click range of the mouse, or None.
+    Items spawn at least conveyor_min_gap apart, so each lookup bucket holds
+    at most one item and only the buckets near the mouse need checking."""
+    if app.game.conveyor_count == 0:
+        return None
+    spawn_offset = app.game.belt_offset - (mouse_x - app.game.conveyor_start_x)
+    first = int((spawn_offset - 15) // app.game.conveyor_min_gap)
+    last = int((spawn_offset + 15) // app.game.conveyor_min_gap)
+    for bucket in range(first, last + 1):
+        slot = app.game.conveyor_lookup.get(bucket)
+        if slot is not None:
+            food = app.game.conveyor_slots[slot]
+            # Simple distance check for food items
+            if (food_x(food) - mouse_x)**2 + (food.centerY - mouse_y)**2 < 15**2:  # Click radius
+                return food
+    return None
+
 def update_conveyor_belt():
     """Update conveyor belt and food items"""
     app.game.conveyor_timer += 1
@@ -614,60 +707,63 @@ def update_conveyor_belt():
         app.game.conveyor_timer = 0
 
         # Check if we need a new food item
-        if len(app.game.conveyor_items) < 5:  # Max 5 items on conveyor
+        if (app.game.conveyor_count < app.game.conveyor_max_items and
+            app.game.conveyor_used < app.game.conveyor_capacity):
             # Check if the last item has moved far enough to make space
-            if not app.game.conveyor_items or app.game.conveyor_items[-1].centerX > app.game.conveyor_x - app.game.conveyor_width/2 + app.game.conveyor_spacing:
-                food_item = create_food_item()
-                app.game.conveyor_items.append(food_item)
-
-    # Move existing food items at the same speed
-    for food in app.game.conveyor_items[:]:  # Use slice copy to avoid modification while iterating
-        food.centerX += app.game.conveyor_speed
-
-        # Remove food if it reaches the end of the conveyor
-        if food.centerX > app.game.conveyor_x + app.game.conveyor_width/2:
-            food.visible = False
-            app.game.conveyor_items.remove(food)
-
-            # Increase food production when food reaches the end
-            app.game.food_production = min(100, app.game.food_production + 1)
-
-def calculate_production():
-    """Calculate daily food production changes"""
-    base_production_rate = 0.15
-    max_production = 100
-
-    # Pollution reduces production rate
-    pollution_factor = 1 - (app.game.pollution_level / 500) * 0.6
-    base_production_rate *= max(0.4, pollution_factor)
-
-    # Calculate average size of harvested crops
-    if app.game.produced_food_types:
-        crop_types = set(app.game.produced_food_types)
-        diversity_bonus = min(0.2, len(crop_types) * 0.05)
-        production_rate = base_production_rate * (1 + diversity_bonus)
-    else:
-        production_rate = base_production_rate
-
-    # Calculate production and waste
-    production = app.game.food_production * production_rate * (1 - app.game.food_production / max_production)
-    waste_rate = (app.game.pollution_level / 500) * 0.20
-    waste = int(app.game.food_production * waste_rate)
-
-    # Apply changes
-    app.game.food_production = max(0, int(app.game.food_production + production - waste))
-    app.game.produced_food_types = []
-
-def update_hunger():
-    """Update community food level based on produced food"""
-    food_deficit = max(0, app.game.food_decrease_base - app.game.produced_food_today)
-    app.game.food_level = max(0, app.game.food_level - food_deficit * 0.5)
-    if app.game.food_level <= 0:
-        app.game.game_over = True
+            if (app.game.last_spawn_offset is None or
+                app.game.belt_offset - app.game.last_spawn_offset > app.game.conveyor_min_gap):
+                add_to_conveyor(create_food_item())
+
+    # Move every food item at once by moving the belt
+    app.game.belt_offset += app.game.conveyor_speed
+    if app.game.conveyor_count:
+        app.game.conveyor_food.centerX += app.game.conveyor_speed
+
+    # Only the oldest items can reach the end of the conveyor
+    while app.game.conveyor_used:
+        food = app.game.conveyor_slots[app.game.conveyor_head]
+        if food is None:  # Picked up earlier
+            advance_conveyor_head()
+            continue
+        if food_x(food) <= app.game.conveyor_end_x:
+            break
+
+        take_from_conveyor(food)
+        advance_conveyor_head()
+        release_food(food)
+
+        # Increase food production when food reaches the end
+        set_food_state(app.game.economy.apply(get_food_state(), CONVEYOR_EXPIRE))
+
+def get_food_state():
+    """The parts of the game that the food economy works on"""
+    return FoodState(app.game.food_level, app.game.food_waste, app.game.pollution_level,
+                     app.game.food_production, app.game.produced_food_today, app.game.day)
+
+def set_food_state(state):
+    app.game.food_level = state.food_level
+    app.game.food_waste = state.food_waste
+    app.game.pollution_level = state.pollution_level
+    app.game.food_production = state.food_production
+    app.game.produced_food_today = state.produced_today
+    app.game.day = state.day
+    update_stat_labels()
+
+def update_stat_labels():
+    """Redraw the stats panel from the current food state"""
+    app.game.day_label.value = f'Day: {app.game.day}/{app.game.target_days}'
+    app.game.produced_label.value = f'Produced: {app.game.produced_food_today}/5'
+    app.game.food_label.value = f'Food: {int(app.game.food_level)}%'
+    app.game.waste_label.value = f'Waste: {int(app.game.food_waste)}%'
+    app.game.pollution_label.value = f'Pollution: {min(100, int(app.game.pollution_level / 5))}%'
+    for label in (app.game.day_label, app.game.produced_label, app.game.food_label,
+                  app.game.waste_label, app.game.pollution_label):
+        label.left = 20
 
 def check_game_over():
     """Check if any failure conditions are met or if player has won"""
-    if app.game.food_level <= 0:
+    result = app.game.economy.outcome(get_food_state())
+    if result == 'starved':
         app.game.game_over = True
         app.game.game_over_screen.visible = True
         app.game.game_over_screen.toFront()
@@ -676,13 +772,13 @@ def check_game_over():
         update_hunger_bar()
         # Clear any selected items
         if app.game.selected_food:
-            app.game.selected_food.visible = False
+            release_food(app.game.selected_food)
             app.game.selected_food = None
         if app.game.selected_waste:
             app.game.selected_waste.visible = False
             app.game.selected_waste = None
         return True
-    elif app.game.pollution_level >= 500:
+    elif result == 'polluted':
         app.game.game_over = True
         app.game.game_over_screen.visible = True
         app.game.game_over_screen.toFront()
@@ -691,13 +787,13 @@ def check_game_over():
         app.game.game_over_screen.children[3].value = f'Final food production: {app.game.food_production}'
         # Clear any selected items
         if app.game.selected_food:
-            app.game.selected_food.visible = False
+            release_food(app.game.selected_food)
             app.game.selected_food = None
         if app.game.selected_waste:
             app.game.selected_waste.visible = False
             app.game.selected_waste = None
         return True
-    elif app.game.food_waste >= 100:  # New waste-based game over condition
+    elif result == 'wasted':  # New waste-based game over condition
         app.game.game_over = True
         app.game.game_over_screen.visible = True
         app.game.game_over_screen.toFront()
@@ -705,7 +801,7 @@ def check_game_over():
         app.game.game_over_screen.children[2].value = 'Waste management has failed! The facility is overwhelmed with waste!'
         app.game.game_over_screen.children[3].value = f'Final food production: {app.game.food_production}'
         return True
-    elif app.game.day >= app.game.target_days:
+    elif result == 'won':
         app.game.game_over = True
         app.game.game_over_screen.visible = True
         app.game.game_over_screen.toFront()
@@ -715,7 +811,7 @@ def check_game_over():
         update_hunger_bar()
         # Clear any selected items
         if app.game.selected_food:
-            app.game.selected_food.visible = False
+            release_food(app.game.selected_food)
             app.game.selected_food = None
         if app.game.selected_waste:
             app.game.selected_waste.visible = False
@@ -723,198 +819,213 @@ def check_game_over():
         return True
     return False
 
-def create_waste():
-    # Define waste types with their correct destinations and descriptions
-    waste_types = [
-        # Compostable waste (organic materials that can decompose)
-        {
-            'type': 'apple_peels',
-            'destination': 'compost',
-            'description': 'Apple peels',
-            'color': 'red',
-            'shape': 'apple'
-        },
-        {
-            'type': 'corn_husks',
-            'destination': 'compost',
-            'description': 'Corn husks',
-            'color': 'yellow',
-            'shape': 'corn'
-        },
-        {
-            'type': 'potato_skins',
-            'destination': 'compost',
-            'description': 'Potato skins',
-            'color': 'brown',
-            'shape': 'potato'
-        },
-        {
-            'type': 'carrot_tops',
-            'destination': 'compost',
-            'description': 'Carrot tops',
-            'color': 'green',
-            'shape': 'carrot'
-        },
-        {
-            'type': 'rice_hulls',
-            'destination': 'compost',
-            'description': 'Rice hulls',
-            'color': 'tan',
-            'shape': 'rice'
-        },
-
-        # Non-compostable waste (materials that shouldn't decompose)
-        {
-            'type': 'plastic_wrappers',
-            'destination': 'trash',
-            'description': 'Plastic wrappers',
-            'color': 'blue',
-            'shape': 'wrapper'
-        },
-        {
-            'type': 'tin_cans',
-            'destination': 'trash',
-            'description': 'Tin cans',
-            'color': 'gray',
-            'shape': 'can'
-        },
-        {
-            'type': 'rubber_bands',
-            'destination': 'trash',
-            'description': 'Rubber bands',
-            'color': 'black',
-            'shape': 'band'
-        },
-        {
-            'type': 'twine',
-            'destination': 'trash',
-            'description': 'Twine',
-            'color': 'white',
-            'shape': 'twine'
-        },
-        {
-            'type': 'labels',
-            'destination': 'trash',
-            'description': 'Labels',
-            'color': 'red',
-            'shape': 'label'
-        }
-    ]
-
-    # Create waste group
-    waste = Group()
-
-    # Randomly select a waste type
-    waste_type = random.choice(waste_types)
-
-    # Create waste item based on type
-    if waste_type['shape'] == 'apple':
-        # Apple core with peels
-        core = Circle(0, 0, 10, fill='white')
-        peel1 = Arc(0, 0, 20, 20, 0, 180, fill='red')
-        peel2 = Arc(0, 0, 20, 20, 180, 180, fill='red')
-        stem = Line(0, -10, 0, -15, fill='brown', lineWidth=2)
-        leaf = Oval(2, -15, 6, 3, fill='green')
-        waste.add(core)
-        waste.add(peel1)
-        waste.add(peel2)
-        waste.add(stem)
-        waste.add(leaf)
-
-    elif waste_type['shape'] == 'corn':
-        # Corn cob with partially peeled husks
-        cob = Oval(0, 0, 8, 15, fill='yellow')
-        waste.add(cob)
-        # Add some kernel texture
-        for i in range(3):
-            kernel = Circle(0, -5 + i*5, 0.5, fill=rgb(255, 200, 0))
-            waste.add(kernel)
-
-        # Add two husks that are partially peeled back
-        husk1 = Arc(0, 10, 20, 15, 180, 135, fill='lightGreen')
-        husk2 = Arc(0, 10, 20, 15, 45, 135, fill='lightGreen')
-        waste.add(husk1)
-        waste.add(husk2)
-
-    elif waste_type['shape'] == 'potato':
-        # Potato with skin
-        potato = Oval(0, 0, 15, 10, fill='brown')
-        skin = Arc(0, 0, 20, 15, 0, 180, fill='tan')
-        eye1 = Circle(-5, -2, 1, fill='black')
-        eye2 = Circle(5, 2, 1, fill='black')
-        waste.add(potato)
-        waste.add(skin)
-        waste.add(eye1)
-        waste.add(eye2)
-
-    elif waste_type['shape'] == 'carrot':
-        # Carrot top with greens
-        carrot = Polygon(-5, 0, 5, 0, 3, 15, -3, 15, fill='orange')
-        greens = Group()
-        for i in range(5):
-            leaf = Line(-5 + i*2.5, 0, -3 + i*2.5, -8, fill='green', lineWidth=2)
-            greens.add(leaf)
-        waste.add(carrot)
-        waste.add(greens)
-
-    elif waste_type['shape'] == 'rice':
-        # Rice hulls
-        hulls = Group()
-        for i in range(3):
-            hull = Oval(-10 + i*10, 0, 8, 4, fill='tan')
-            hulls.add(hull)
-        waste.add(hulls)
-
-    elif waste_type['shape'] == 'wrapper':
-        # Plastic wrapper
-        wrapper = Rect(-10, -5, 20, 10, fill='lightBlue')
-        fold1 = Line(-10, 0, 10, 0, fill='white', lineWidth=1)
-        fold2 = Line(0, -5, 0, 5, fill='white', lineWidth=1)
-        waste.add(wrapper)
-        waste.add(fold1)
-        waste.add(fold2)
-
-    elif waste_type['shape'] == 'can':
-        # Tin can
-        can = Rect(-6, -12, 12, 24, fill='silver')
-        top = Circle(0, -12, 6, fill='silver')
-        bottom = Circle(0, 12, 6, fill='silver')
-        rim = Circle(0, -12, 6, fill=None, border='gray', borderWidth=1)
-        waste.add(can)
-        waste.add(top)
-        waste.add(bottom)
-        waste.add(rim)
-
-    elif waste_type['shape'] == 'band':
-        # Rubber band
-        band = Circle(0, 0, 12, fill=None, border='black', borderWidth=3)
-        waste.add(band)
-
-    elif waste_type['shape'] == 'twine':
-        # Twine
-        twine = Group()
-        for i in range(3):
-            strand = Line(-15 + i*15, -2, -15 + i*15, 2, fill='white', lineWidth=2)
-            twine.add(strand)
-        waste.add(twine)
-
-    elif waste_type['shape'] == 'label':
-        # Produce label
-        label = Rect(-8, -4, 16, 8, fill='red')
-        text = Label('PLU', 0, 0, size=6, fill='white', bold=True)
-        waste.add(label)
-        waste.add(text)
+# Every kind of waste, with its correct destination and description.
+# Built once when the game loads instead of on every create_waste call.
+WASTE_CATALOG = [
+    # Compostable waste (organic materials that can decompose)
+    {
+        'type': 'apple_peels',
+        'destination': 'compost',
+        'description': 'Apple peels',
+        'color': 'red',
+        'shape': 'apple'
+    },
+    {
+        'type': 'corn_husks',
+        'destination': 'compost',
+        'description': 'Corn husks',
+        'color': 'yellow',
+        'shape': 'corn'
+    },
+    {
+        'type': 'potato_skins',
+        'destination': 'compost',
+        'description': 'Potato skins',
+        'color': 'brown',
+        'shape': 'potato'
+    },
+    {
+        'type': 'carrot_tops',
+        'destination': 'compost',
+        'description': 'Carrot tops',
+        'color': 'green',
+        'shape': 'carrot'
+    },
+    {
+        'type': 'rice_hulls',
+        'destination': 'compost',
+        'description': 'Rice hulls',
+        'color': 'tan',
+        'shape': 'rice'
+    },
+
+    # Non-compostable waste (materials that shouldn't decompose)
+    {
+        'type': 'plastic_wrappers',
+        'destination': 'trash',
+        'description': 'Plastic wrappers',
+        'color': 'blue',
+        'shape': 'wrapper'
+    },
+    {
+        'type': 'tin_cans',
+        'destination': 'trash',
+        'description': 'Tin cans',
+        'color': 'gray',
+        'shape': 'can'
+    },
+    {
+        'type': 'rubber_bands',
+        'destination': 'trash',
+        'description': 'Rubber bands',
+        'color': 'black',
+        'shape': 'band'
+    },
+    {
+        'type': 'twine',
+        'destination': 'trash',
+        'description': 'Twine',
+        'color': 'white',
+        'shape': 'twine'
+    },
+    {
+        'type': 'labels',
+        'destination': 'trash',
+        'description': 'Labels',
+        'color': 'red',
+        'shape': 'label'
+    }
+]
+
+# ---------------------------------------
+# WASTE SPRITES
+# Each builder returns the shapes for one waste shape, drawn around (0, 0).
+# They only run when a pool needs a new sprite; after that, sorted waste
+# goes back to app.game.waste_pool and is shown again for the next item.
+# ---------------------------------------
+def build_apple_waste():
+    # Apple core with peels
+    core = Circle(0, 0, 10, fill='white')
+    peel1 = Arc(0, 0, 20, 20, 0, 180, fill='red')
+    peel2 = Arc(0, 0, 20, 20, 180, 180, fill='red')
+    stem = Line(0, -10, 0, -15, fill='brown', lineWidth=2)
+    leaf = Oval(2, -15, 6, 3, fill='green')
+    return [core, peel1, peel2, stem, leaf]
+
+def build_corn_waste():
+    # Corn cob with partially peeled husks
+    shapes = [Oval(0, 0, 8, 15, fill='yellow')]
+    # Add some kernel texture
+    for i in range(3):
+        shapes.append(Circle(0, -5 + i*5, 0.5, fill=rgb(255, 200, 0)))
+
+    # Add two husks that are partially peeled back
+    shapes.append(Arc(0, 10, 20, 15, 180, 135, fill='lightGreen'))
+    shapes.append(Arc(0, 10, 20, 15, 45, 135, fill='lightGreen'))
+    return shapes
+
+def build_potato_waste():
+    # Potato with skin
+    potato = Oval(0, 0, 15, 10, fill='brown')
+    skin = Arc(0, 0, 20, 15, 0, 180, fill='tan')
+    eye1 = Circle(-5, -2, 1, fill='black')
+    eye2 = Circle(5, 2, 1, fill='black')
+    return [potato, skin, eye1, eye2]
+
+def build_carrot_waste():
+    # Carrot top with greens
+    carrot = Polygon(-5, 0, 5, 0, 3, 15, -3, 15, fill='orange')
+    greens = Group()
+    for i in range(5):
+        leaf = Line(-5 + i*2.5, 0, -3 + i*2.5, -8, fill='green', lineWidth=2)
+        greens.add(leaf)
+    return [carrot, greens]
+
+def build_rice_waste():
+    # Rice hulls
+    hulls = Group()
+    for i in range(3):
+        hull = Oval(-10 + i*10, 0, 8, 4, fill='tan')
+        hulls.add(hull)
+    return [hulls]
+
+def build_wrapper_waste():
+    # Plastic wrapper
+    wrapper = Rect(-10, -5, 20, 10, fill='lightBlue')
+    fold1 = Line(-10, 0, 10, 0, fill='white', lineWidth=1)
+    fold2 = Line(0, -5, 0, 5, fill='white', lineWidth=1)
+    return [wrapper, fold1, fold2]
+
+def build_can_waste():
+    # Tin can
+    can = Rect(-6, -12, 12, 24, fill='silver')
+    top = Circle(0, -12, 6, fill='silver')
+    bottom = Circle(0, 12, 6, fill='silver')
+    rim = Circle(0, -12, 6, fill=None, border='gray', borderWidth=1)
+    return [can, top, bottom, rim]
+
+def build_band_waste():
+    # Rubber band
+    return [Circle(0, 0, 12, fill=None, border='black', borderWidth=3)]
+
+def build_twine_waste():
+    # Twine
+    twine = Group()
+    for i in range(3):
+        strand = Line(-15 + i*15, -2, -15 + i*15, 2, fill='white', lineWidth=2)
+        twine.add(strand)
+    return [twine]
+
+def build_label_waste():
+    # Produce label
+    label = Rect(-8, -4, 16, 8, fill='red')
+    text = Label('PLU', 0, 0, size=6, fill='white', bold=True)
+    return [label, text]
+
+WASTE_BUILDERS = {
+    'apple': build_apple_waste,
+    'corn': build_corn_waste,
+    'potato': build_potato_waste,
+    'carrot': build_carrot_waste,
+    'rice': build_rice_waste,
+    'wrapper': build_wrapper_waste,
+    'can': build_can_waste,
+    'band': build_band_waste,
+    'twine': build_twine_waste,
+    'label': build_label_waste,
+}
+
+def build_waste(waste_type):
+    """Build a new, hidden sprite for one entry of WASTE_CATALOG"""
+    waste = Group(*WASTE_BUILDERS[waste_type['shape']]())
 
     # Add description label
-    label = Label(waste_type['description'], 0, 25, size=10, fill='black')
-    waste.add(label)
+    waste.add(Label(waste_type['description'], 0, 25, size=10, fill='black'))
 
     # Store waste type and destination
     waste.waste_type = waste_type['type']
     waste.destination = waste_type['destination']
+    waste.visible = False
+    return waste
+
+def create_waste_pool():
+    """One prebuilt sprite for every kind of waste, keyed by waste type"""
+    return {waste_type['type']: [build_waste(waste_type)] for waste_type in WASTE_CATALOG}
 
+def create_waste():
+    """Take a sprite for a random kind of waste from the pool"""
+    waste_type = random.choice(WASTE_CATALOG)
+    pool = app.game.waste_pool[waste_type['type']]
+    waste = pool.pop() if pool else build_waste(waste_type)
+    waste.visible = True
     return waste
 
+def release_waste(waste):
+    """Take sorted waste off the screen and put it back in the pool"""
+    app.game.waste.remove(waste)
+    waste.visible = False
+    app.game.waste_pool[waste.waste_type].append(waste)
+
 def update_waste():
     """Update waste positions and create new waste"""
     # Create new waste - now only happens when food is produced (in try_produce_food)
@@ -1027,17 +1138,16 @@ def try_process_food(mouse_x, mouse_y, process_type='food'):
         return
 
     # Check if a food item is being clicked
-    for food in app.game.conveyor_items[:]:
-        # Simple distance check for food items
-        distance = math.sqrt((food.centerX - mouse_x)**2 + (food.centerY - mouse_y)**2)
-        if distance < 15:  # Click radius
-            # Only select if nothing else is currently selected
-            if app.game.selected_food is None and app.game.selected_waste is None:
-                # Food item clicked - select it
-                app.game.selected_food = food
-                app.game.conveyor_items.remove(food)
-                return True
-            return False  # Ignore click if something else is selected
+    food = food_at(mouse_x, mouse_y)
+    if food is not None:
+        # Only select if nothing else is currently selected
+        if app.game.selected_food is None and app.game.selected_waste is None:
+            # Food item clicked - select it
+            app.game.selected_food = food
+            take_from_conveyor(food)
+            app.group.add(food)  # Keep drawing it while it follows the mouse
+            return True
+        return False  # Ignore click if something else is selected
 
     # Check if selected food is being dropped in the collection area
     if app.game.selected_food:
@@ -1051,36 +1161,10 @@ def try_process_food(mouse_x, mouse_y, process_type='food'):
             app.game.food_collection_count += 1
             app.game.food_collection_area.children[4].value = f'{app.game.food_collection_count}/{app.game.food_collection_target}'
 
-            # Update production counter
-            app.game.produced_food_today += 1
-            app.game.food_production += 1  # Increment total food production
-            app.game.produced_food_types.append(app.game.selected_food.food_type)
-            app.game.produced_label.value = f'Produced: {app.game.produced_food_today}/5'
-            app.game.produced_label.left = 20
-
-            # Use the food's is_bonus property to determine process type
-            process_type = 'bonus' if app.game.selected_food.is_bonus else 'food'
-
-            # Increase food level based on process type
-            if process_type == 'food':
-                food_increase = min(15, 5 + random.randint(0, 5))
-            else:  # bonus food
-                food_increase = min(25, 15 + random.randint(0, 10))
-            app.game.food_level = min(100, app.game.food_level + food_increase)
-            app.game.food_label.value = f'Food: {int(app.game.food_level)}%'
-            app.game.food_label.left = 20
-
-            # Increase waste and pollution from food production
-            if process_type == 'food':
-                waste_increase = app.game.food_production_waste
-                pollution_increase = app.game.food_production_pollution
-            else:  # bonus food produces more waste and pollution
-                waste_increase = app.game.food_production_waste * 2
-                pollution_increase = app.game.food_production_pollution * 2
-
-            app.game.food_waste = min(100, app.game.food_waste + waste_increase)
-            app.game.waste_label.value = f'Waste: {int(app.game.food_waste)}%'
-            app.game.waste_label.left = 20
+            # Use the food's is_bonus property to determine process type.
+            # Producing food feeds the community and adds waste and pollution.
+            event = PROCESS_BONUS if app.game.selected_food.is_bonus else PROCESS_FOOD
+            set_food_state(app.game.economy.apply(get_food_state(), event))
 
             # Check for waste-based game over immediately
             if app.game.food_waste >= 100:
@@ -1092,12 +1176,6 @@ def try_process_food(mouse_x, mouse_y, process_type='food'):
                 app.game.game_over_screen.children[3].value = f'Final food production: {app.game.food_production}'
                 return True
 
-            # Increase pollution from food production and current waste level
-            pollution_increase += (app.game.food_waste * app.game.waste_pollution_factor / 100)
-            app.game.pollution_level = min(500, app.game.pollution_level + pollution_increase)
-            app.game.pollution_label.value = f'Pollution: {min(100, int(app.game.pollution_level / 5))}%'
-            app.game.pollution_label.left = 20
-
             # Create waste when food is produced
             if len(app.game.waste.children) < app.game.max_waste_to_sort:
                 waste = create_waste()
@@ -1110,7 +1188,7 @@ def try_process_food(mouse_x, mouse_y, process_type='food'):
                     waste.centerY = 280
 
             # Remove the food item
-            app.game.selected_food.visible = False
+            release_food(app.game.selected_food)
             app.game.selected_food = None
 
             # Check if we've collected enough food
@@ -1140,23 +1218,11 @@ def try_process_food(mouse_x, mouse_y, process_type='food'):
             if app.game.selected_waste.destination == 'compost':
                 app.game.sorting_correct += 1
                 # Reduce waste and pollution for correct sorting
-                app.game.food_waste = max(0, app.game.food_waste - app.game.correct_sort_reduction)
-                app.game.waste_label.value = f'Waste: {int(app.game.food_waste)}%'
-                app.game.waste_label.left = 20
-
-                app.game.pollution_level = max(0, app.game.pollution_level - app.game.correct_sort_pollution_reduction)
-                app.game.pollution_label.value = f'Pollution: {min(100, int(app.game.pollution_level / 5))}%'
-                app.game.pollution_label.left = 20
+                set_food_state(app.game.economy.apply(get_food_state(), SORT_CORRECT))
             else:
                 app.game.sorting_incorrect += 1
                 # Increase waste and pollution for incorrect sorting
-                app.game.food_waste = min(100, app.game.food_waste + app.game.incorrect_sort_waste_increase)
-                app.game.waste_label.value = f'Waste: {int(app.game.food_waste)}%'
-                app.game.waste_label.left = 20
-
-                app.game.pollution_level = min(500, app.game.pollution_level + app.game.incorrect_sort_pollution_increase)
-                app.game.pollution_label.value = f'Pollution: {min(100, int(app.game.pollution_level / 5))}%'
-                app.game.pollution_label.left = 20
+                set_food_state(app.game.economy.apply(get_food_state(), SORT_INCORRECT))
 
                 # Show error feedback
                 app.game.feedback_text.value = f'Incorrect! {app.game.selected_waste.waste_type.replace("_", " ").title()} should go in TRASH'
@@ -1169,8 +1235,7 @@ def try_process_food(mouse_x, mouse_y, process_type='food'):
             app.game.feedback_label = app.game.feedback_text
 
             # Remove waste from game
-            app.game.waste.remove(app.game.selected_waste)
-            app.game.selected_waste.visible = False
+            release_waste(app.game.selected_waste)
             app.game.selected_waste = None
 
             # Update sorting stats
@@ -1186,23 +1251,11 @@ def try_process_food(mouse_x, mouse_y, process_type='food'):
             if app.game.selected_waste.destination == 'trash':
                 app.game.sorting_correct += 1
                 # Reduce waste and pollution for correct sorting
-                app.game.food_waste = max(0, app.game.food_waste - app.game.correct_sort_reduction)
-                app.game.waste_label.value = f'Waste: {int(app.game.food_waste)}%'
-                app.game.waste_label.left = 20
-
-                app.game.pollution_level = max(0, app.game.pollution_level - app.game.correct_sort_pollution_reduction)
-                app.game.pollution_label.value = f'Pollution: {min(100, int(app.game.pollution_level / 5))}%'
-                app.game.pollution_label.left = 20
+                set_food_state(app.game.economy.apply(get_food_state(), SORT_CORRECT))
             else:
                 app.game.sorting_incorrect += 1
                 # Increase waste and pollution for incorrect sorting
-                app.game.food_waste = min(100, app.game.food_waste + app.game.incorrect_sort_waste_increase)
-                app.game.waste_label.value = f'Waste: {int(app.game.food_waste)}%'
-                app.game.waste_label.left = 20
-
-                app.game.pollution_level = min(500, app.game.pollution_level + app.game.incorrect_sort_pollution_increase)
-                app.game.pollution_label.value = f'Pollution: {min(100, int(app.game.pollution_level / 5))}%'
-                app.game.pollution_label.left = 20
+                set_food_state(app.game.economy.apply(get_food_state(), SORT_INCORRECT))
 
                 # Show error feedback
                 app.game.feedback_text.value = f'Incorrect! {app.game.selected_waste.waste_type.replace("_", " ").title()} should go in COMPOST'
@@ -1215,8 +1268,7 @@ def try_process_food(mouse_x, mouse_y, process_type='food'):
             app.game.feedback_label = app.game.feedback_text
 
             # Remove waste from game
-            app.game.waste.remove(app.game.selected_waste)
-            app.game.selected_waste.visible = False
+            release_waste(app.game.selected_waste)
             app.game.selected_waste = None
 
             # Update sorting stats
@@ -1233,27 +1285,11 @@ def end_day():
     if check_game_over():
         return
 
-    # Decrease food level each day
-    app.game.food_level = max(0, app.game.food_level - app.game.daily_food_decrease)
-    app.game.food_label.value = f'Food: {int(app.game.food_level)}%'
-    app.game.food_label.left = 20
-
-    # Only increment day if we haven't won yet
-    app.game.day += 1
-    app.game.produced_food_today = 0
+    # Decrease food level each day and, as we haven't won yet, start the next day
+    set_food_state(app.game.economy.end_day(get_food_state()))
     app.game.food_collection_count = 0
     app.game.food_collection_area.children[4].value = f'{app.game.food_collection_count}/{app.game.food_collection_target}'
 
-    # Update stats display
-    app.game.day_label.value = f'Day: {app.game.day}/{app.game.target_days}'
-    app.game.day_label.left = 20
-    app.game.produced_label.value = f'Produced: {app.game.produced_food_today}/5'
-    app.game.produced_label.left = 20
-    app.game.waste_label.value = f'Waste: {int(app.game.food_waste)}%'
-    app.game.waste_label.left = 20
-    app.game.pollution_label.value = f'Pollution: {min(100, int(app.game.pollution_level / 5))}%'
-    app.game.pollution_label.left = 20
-
     if app.game.sorting_correct + app.game.sorting_incorrect > 0:
         app.game.sorting_label.value = f'Sorting: {app.game.sorting_correct}/{app.game.sorting_correct + app.game.sorting_incorrect}'
     else:
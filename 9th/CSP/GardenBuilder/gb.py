@@ -9,60 +9,11 @@
 
 from cmu_graphics import *
 import random
+import gb_engine as engine
+import gb_replay
 
-def createPlant(row, col):
-    """Create a new plant using Group with attributes"""
-    plant = Group()
-    # Plant attributes
-    plant.row = row
-    plant.col = col
-    plant.type = "flower"
-    plant.growth_stage = 0
-    plant.has_pests = False
-    plant.water_needed = 0  # This will now represent water icons (0-3)
-    plant.is_fertilized = False
-    plant.days_without_water = 0  # Track consecutive days without water
-    plant.germination_days = 0  # Track days as a seed
-    return plant
-
-# Plant functions
-def waterPlant(plant):
-    plant.water_needed = 0  # Remove all water icons
-    plant.days_without_water = 0  # Reset days without water
-
-def fertilizePlant(plant):
-    plant.is_fertilized = True
-
-def removePests(plant):
-    plant.has_pests = False
-
-def addGrowth(plant):
-    plant.growth_stage = min(app.maxStages, plant.growth_stage + 1)
-
-def reduceGrowth(plant):
-    plant.growth_stage = max(0, plant.growth_stage - 1)
-
-def isFullyGrown(plant):
-    return plant.growth_stage >= app.maxStages
-
-def resetDaily(plant):
-    """Reset daily attributes and update water status"""
-    plant.is_fertilized = False
-    plant.days_without_water += 1
-
-    # Update water needs based on days without water
-    if plant.days_without_water >= 1:
-        plant.water_needed = min(3, plant.days_without_water)
-
-    # Only add pests to plants that have sprouted (growth_stage > 0)
-    if plant.growth_stage > 0 and random.randrange(0, 5) == 0:  # 20% chance to get pests each day
-        plant.has_pests = True
-
-def plantDies(plant):
-    """Remove a plant and clean up its Group object"""
-    plant.visible = False  # Hide the Group object
-    app.grid[plant.row][plant.col] = None
-    clearPlantShapes(plant.row, plant.col)
+# The game rules live in gb_engine.py. This file only keeps the window in
+# sync with app.state, a GardenState that holds the grid and counters.
 
 # ---------------------------------------
 # SETUP APP VARIABLES
@@ -77,44 +28,50 @@ def onAppStart():
     app.maxStages = 4
     app.maxActions = 5  # Maximum actions per day
 
-    # Each cell will contain a Plant group or None
-    app.grid = []
-    app.cellPlants = []
-    app.cellBackgrounds = []
-
-    # Game state
-    app.dayCounter = 0
+    # Game state (grid of plants, day and action counters)
+    rules = {'rows': app.rows, 'cols': app.cols, 'maxDays': app.maxDays,
+             'maxStages': app.maxStages, 'maxActions': app.maxActions}
+    app.state = engine.GardenState(**rules)
     app.actionMode = 'seed'
-    app.gameOver = False
-    app.actionsLeft = app.maxActions  # Track remaining actions
+
+    # Each game has its own seed, and everything the player does is logged
+    # so the game can be replayed headlessly with gb_replay.py
+    app.seed = random.randrange(1000000)
+    app.rng = random.Random(app.seed)
+    app.replay = gb_replay.ReplayLog(app.seed, rules)
+
+    # Pool of prebuilt plant shapes for each cell (built the first time a
+    # cell gets a plant, then shown, hidden and recoloured in place)
+    app.cellPools = []
+    app.cellBackgrounds = []
 
     # Display for day and action
-    app.display = Label(f"Day: {app.dayCounter}   Action: {app.actionMode.upper()}   Actions Left: {app.actionsLeft}", 10,
+    app.display = Label(f"Day: {app.state.dayCounter}   Action: {app.actionMode.upper()}   Actions Left: {app.state.actionsLeft}", 10,
             app.rows * app.cellSize + 10, align='left', size=14, fill='black')
 
+    # Live board summary, read from the engine's counters
+    app.summary = Label('', 10, app.rows * app.cellSize + 25, align='left', size=11, fill='black')
+
     app.tick = 0
     setupGame()
+    updateDayDisplay()
 
 # ---------------------------------------
 # SETUP GAME
 # ---------------------------------------
 def setupGame():
     for r in range(app.rows):
-        rowData = []
-        rowPlantShapes = []
+        rowPools = []
         rowBG = []
 
         for c in range(app.cols):
-            rowData.append(None)  # Start with no plant
-
             xPos = c * app.cellSize
             yPos = r * app.cellSize
             bg = Rect(xPos, yPos, app.cellSize, app.cellSize, fill='saddlebrown', border='black', borderWidth=1)
             rowBG.append(bg)
-            rowPlantShapes.append([])
+            rowPools.append(None)
 
-        app.grid.append(rowData)
-        app.cellPlants.append(rowPlantShapes)
+        app.cellPools.append(rowPools)
         app.cellBackgrounds.append(rowBG)
 
     Label("Press s/w/f/x to set action, click cells, press d to end day", 10,
@@ -122,16 +79,87 @@ def setupGame():
     Label("Goal: After 20 days, grow as many flowers as possible!", 10,
           app.rows * app.cellSize + 60, size=14, fill='black', align='left')
 
-def drawPlant(r, c, stage):
+def buildCellPool(r, c):
     """
-    Draw shapes for a plant at a given growth stage.
+    Build every shape a plant in this cell can show, all hidden.
+    Each stage gets its own list of (shape, part) pairs, where part says
+    which color the shape takes ('seed', 'stem', 'leaf', 'petal' or 'center').
     """
     xPos = c * app.cellSize
     yPos = r * app.cellSize
     centerX = xPos + app.cellSize/2
     centerY = yPos + app.cellSize/2
 
-    plant = app.grid[r][c]
+    stages = [
+        # Stage 0: seed
+        [(Circle(centerX, centerY, 6), 'seed')],
+
+        # Stage 1: small sprout
+        [(Circle(centerX, centerY + 10, 6), 'seed'),
+         (Rect(centerX - 2, centerY - 10, 4, 20), 'stem'),
+         (Oval(centerX - 8, centerY - 10, 16, 8), 'leaf'),
+         (Oval(centerX + 8, centerY - 10, 16, 8), 'leaf')],
+
+        # Stage 2: developing plant
+        [(Circle(centerX, centerY + 10, 6), 'seed'),
+         (Rect(centerX - 2, centerY - 20, 4, 30), 'stem'),
+         (Oval(centerX - 8, centerY - 10, 16, 8), 'leaf'),
+         (Oval(centerX + 8, centerY - 10, 16, 8), 'leaf'),
+         (Oval(centerX, centerY - 20, 8, 16), 'leaf')],
+
+        # Stage 3: mature plant
+        [(Rect(centerX - 2, centerY - 20, 4, 35), 'stem'),
+         (Oval(centerX - 8, centerY, 16, 8), 'leaf'),
+         (Oval(centerX + 8, centerY, 16, 8), 'leaf'),
+         (Oval(centerX - 8, centerY - 10, 16, 8), 'leaf'),
+         (Oval(centerX + 8, centerY - 10, 16, 8), 'leaf'),
+         (Oval(centerX, centerY - 20, 8, 16), 'leaf')],
+
+        # Stage 4: fully grown flower
+        [(Rect(centerX - 2, centerY - 15, 4, 30), 'stem'),
+         (Oval(centerX - 8, centerY, 16, 8), 'leaf'),
+         (Oval(centerX + 8, centerY, 16, 8), 'leaf'),
+         (Circle(centerX - 5, centerY - 15, 5), 'petal'),
+         (Circle(centerX + 5, centerY - 15, 5), 'petal'),
+         (Circle(centerX, centerY - 20, 5), 'petal'),
+         (Circle(centerX, centerY - 11, 5), 'petal'),
+         (Circle(centerX, centerY - 15, 5), 'center')]
+    ]
+
+    # Pest indicator in top-right
+    bug = Circle(xPos + app.cellSize - 10, yPos + 10, 5, fill='red')
+
+    # Water droplets in bottom-right, from the bottom up
+    drops = []
+    for i in range(3):
+        dropY = yPos + app.cellSize - 10 - (i * 15)
+        drop = Circle(xPos + app.cellSize - 10, dropY, 5, fill='skyBlue')
+        dropTop = Circle(xPos + app.cellSize - 10, dropY - 3, 3, fill='skyBlue')
+        drops.append([drop, dropTop])
+
+    pool = {'stages': stages, 'bug': bug, 'drops': drops, 'shownStage': None}
+    hidePool(pool)
+    return pool
+
+def hidePool(pool):
+    for stageShapes in pool['stages']:
+        for shape, part in stageShapes:
+            shape.visible = False
+    pool['bug'].visible = False
+    for drop in pool['drops']:
+        for shape in drop:
+            shape.visible = False
+    pool['shownStage'] = None
+
+def drawPlant(r, c, stage):
+    """
+    Show and recolor the pooled shapes for a plant at a given growth stage.
+    """
+    if app.cellPools[r][c] is None:
+        app.cellPools[r][c] = buildCellPool(r, c)
+    pool = app.cellPools[r][c]
+
+    plant = app.state.grid[r][c]
     seedColor = 'sienna'
     stemColor = 'lime'
     leafColor = 'lime'
@@ -139,8 +167,6 @@ def drawPlant(r, c, stage):
     centerColor = 'yellow'
     witheredColor = 'darkGoldenrod'
     witheredColor2 = 'grey'
-    pestColor = 'red'
-    waterColor = 'skyBlue'
 
     # Update colors based on days without water
     if plant.days_without_water >= 2:
@@ -152,191 +178,109 @@ def drawPlant(r, c, stage):
     if plant.is_fertilized:
         seedColor = 'black'
 
-    # Stage 0: seed
-    if stage == 0:
-        seed = Circle(centerX, centerY, 6, fill=seedColor)
-        app.cellPlants[r][c].append(seed)
-
-    # Stage 1: small sprout
-    elif stage == 1:
-        root = Circle(centerX, centerY + 10, 6, fill=seedColor)
-        stem = Rect(centerX - 2, centerY - 10, 4, 20, fill=stemColor)
-        leafLeft = Oval(centerX - 8, centerY - 10, 16, 8, fill=leafColor)
-        leafRight = Oval(centerX + 8, centerY - 10, 16, 8, fill=leafColor)
-        app.cellPlants[r][c].extend([root, stem, leafLeft, leafRight])
-
-    # Stage 2: developing plant
-    elif stage == 2:
-        root = Circle(centerX, centerY + 10, 6, fill=seedColor)
-        stem = Rect(centerX - 2, centerY - 20, 4, 30, fill=stemColor)
-        leafLeft = Oval(centerX - 8, centerY - 10, 16, 8, fill=leafColor)
-        leafRight = Oval(centerX + 8, centerY - 10, 16, 8, fill=leafColor)
-        leafTop = Oval(centerX, centerY - 20, 8, 16, fill=leafColor)
-        app.cellPlants[r][c].extend([root, stem, leafLeft, leafRight, leafTop])
-
-    # Stage 3: mature plant
-    elif stage == 3:
-        stem = Rect(centerX - 2, centerY - 20, 4, 35, fill=stemColor)
-        leafLeft = Oval(centerX - 8, centerY, 16, 8, fill=leafColor)
-        leafRight = Oval(centerX + 8, centerY, 16, 8, fill=leafColor)
-        leafLeft2 = Oval(centerX - 8, centerY - 10, 16, 8, fill=leafColor)
-        leafRight2 = Oval(centerX + 8, centerY - 10, 16, 8, fill=leafColor)
-        leafTop = Oval(centerX, centerY - 20, 8, 16, fill=leafColor)
-        app.cellPlants[r][c].extend([stem, leafLeft, leafRight, leafLeft2, leafRight2, leafTop])
-
-    # Stage 4: fully grown flower
-    else:
-        stem = Rect(centerX - 2, centerY - 15, 4, 30, fill=stemColor)
-        leafLeft = Oval(centerX - 8, centerY, 16, 8, fill=leafColor)
-        leafRight = Oval(centerX + 8, centerY, 16, 8, fill=leafColor)
-        petal1 = Circle(centerX - 5, centerY - 15, 5, fill=petalColor)
-        petal2 = Circle(centerX + 5, centerY - 15, 5, fill=petalColor)
-        petal3 = Circle(centerX, centerY - 20, 5, fill=petalColor)
-        petal4 = Circle(centerX, centerY - 11, 5, fill=petalColor)
-        center = Circle(centerX, centerY - 15, 5, fill=centerColor)
-        app.cellPlants[r][c].extend([stem, leafLeft, leafRight, petal1, petal2, petal3, petal4, center])
+    colors = {'seed': seedColor, 'stem': stemColor, 'leaf': leafColor,
+              'petal': petalColor, 'center': centerColor}
 
-    # Draw indicators
-    # Pest indicator in top-right
-    if plant.has_pests:
-        bug = Circle(xPos + app.cellSize - 10, yPos + 10, 5, fill=pestColor)
-        app.cellPlants[r][c].append(bug)
-
-    # Water droplets in bottom-right
-    if plant.water_needed > 0:
-        for i in range(plant.water_needed):
-            dropY = yPos + app.cellSize - 10 - (i * 15)  # Start from bottom, go up
-            drop = Circle(xPos + app.cellSize - 10, dropY, 5, fill=waterColor)
-            dropTop = Circle(xPos + app.cellSize - 10, dropY - 3, 3, fill=waterColor)
-            app.cellPlants[r][c].extend([drop, dropTop])
+    # Swap which stage is showing
+    stage = min(stage, len(pool['stages']) - 1)
+    if pool['shownStage'] != stage:
+        if pool['shownStage'] is not None:
+            for shape, part in pool['stages'][pool['shownStage']]:
+                shape.visible = False
+        for shape, part in pool['stages'][stage]:
+            shape.visible = True
+        pool['shownStage'] = stage
 
-def handleAction(row, col):
-    if app.gameOver or app.actionsLeft <= 0:  # Check if actions are depleted
-        return
-    if not (0 <= row < app.rows and 0 <= col < app.cols):
-        return
+    for shape, part in pool['stages'][stage]:
+        shape.fill = colors[part]
 
-    plant = app.grid[row][col]
-    actionTaken = False
-
-    if app.actionMode == 'seed':
-        if plant is None:
-            newPlant = createPlant(row, col)
-            app.grid[row][col] = newPlant
-            actionTaken = True
-    elif plant is not None:
-        if app.actionMode == 'water':
-            if plant.water_needed > 0:
-                waterPlant(plant)
-                actionTaken = True
-        elif app.actionMode == 'fertilize':
-            if plant.growth_stage <= 2:  # Only count as action if fertilizer can be applied
-                if not plant.is_fertilized:
-                    fertilizePlant(plant)
-                    actionTaken = True
-        elif app.actionMode == 'preventPests':
-            if plant.has_pests:  # Only count as action if pests are present
-                removePests(plant)
-                actionTaken = True
-
-    if actionTaken:
-        app.actionsLeft -= 1
-        updateCellVisual(row, col)
-        updateDayDisplay()
+    # Draw indicators
+    pool['bug'].visible = plant.has_pests
+    for i in range(len(pool['drops'])):
+        for shape in pool['drops'][i]:
+            shape.visible = i < plant.water_needed
 
-        if app.actionsLeft <= 0:
-            endOfDayUpdate()
+def handleAction(row, col):
+    dayBefore = app.state.dayCounter
+    if engine.handleAction(app.state, row, col, app.actionMode, app.rng):
+        app.replay.recordAction(app.actionMode, row, col)
+        if app.state.dayCounter != dayBefore:  # Last action of the day was used
+            redrawAfterDay()
+        else:
+            redrawDirtyCells()
+            updateDayDisplay()
 
 def updateCellVisual(r, c):
-    clearPlantShapes(r, c)
-    plant = app.grid[r][c]
+    plant = app.state.grid[r][c]
     if plant is not None:
         drawPlant(r, c, plant.growth_stage)
+    else:
+        clearPlantShapes(r, c)
 
 def endOfDayUpdate():
-    if app.gameOver:
+    if app.state.gameOver:
         return
+    engine.endOfDayUpdate(app.state, app.rng)
+    app.replay.recordEndOfDay()
+    redrawAfterDay()
 
-    app.dayCounter += 1
-    app.actionsLeft = app.maxActions  # Reset actions for new day
+def redrawDirtyCells():
+    """Redraw only the cells the engine marked as changed"""
+    for r, c in engine.takeDirtyCells(app.state):
+        updateCellVisual(r, c)
 
-    for r in range(app.rows):
-        for c in range(app.cols):
-            plant = app.grid[r][c]
-            if plant is not None:
-                # Check if plant dies from lack of water
-                if plant.days_without_water >= 3:
-                    plantDies(plant)
-                    continue
-
-                # Handle negative effects (only for sprouted plants)
-                if plant.growth_stage > 0 and plant.has_pests:
-                    if plant.growth_stage == 1:
-                        plantDies(plant)
-                        continue
-                    else:
-                        reduceGrowth(plant)
-
-                # Handle seed germination
-                if plant.growth_stage == 0:
-                    plant.germination_days += 1
-                    if plant.germination_days >= 2:  # Sprout after 2 days
-                        if plant.days_without_water == 0:
-                            plant.growth_stage = 1
-                            plant.germination_days = 0
-
-                # Handle normal growth conditions
-                elif plant.days_without_water <= 1 and not plant.has_pests:
-                    # Plant grows if not withered and no pests
-                    addGrowth(plant)
-
-                # Handle fertilizer bonus (can still grow even if withered)
-                if plant.is_fertilized:
-                    addGrowth(plant)
-
-                resetDaily(plant)
-                updateCellVisual(r, c)
-
-    if app.dayCounter >= app.maxDays:
+def redrawAfterDay():
+    """Redraw the garden after the engine has moved on to the next day"""
+    redrawDirtyCells()
+
+    if app.state.gameOver:
         endGame()
     else:
         updateDayDisplay()
 
 def calculateScore():
-    score = 0
-    for r in range(app.rows):
-        for c in range(app.cols):
-            plant = app.grid[r][c]
-            if plant is not None and isFullyGrown(plant):
-                score += 1
-    return score
+    return engine.calculateScore(app.state)
 
 # Keep existing helper functions and event handlers
 def clearPlantShapes(r, c):
-    for shape in app.cellPlants[r][c]:
-        shape.visible = False
-    app.cellPlants[r][c].clear()
+    pool = app.cellPools[r][c]
+    if pool is not None and pool['shownStage'] is not None:
+        hidePool(pool)
 
 def updateDayDisplay():
-    app.display.value = f"Day: {app.dayCounter}   Action: {app.actionMode.upper()}   Actions Left: {app.actionsLeft}"
+    app.display.value = f"Day: {app.state.dayCounter}   Action: {app.actionMode.upper()}   Actions Left: {app.state.actionsLeft}"
     app.display.left = 10
 
+    counts = engine.boardSummary(app.state)
+    app.summary.value = (f"Seeds: {counts['seeds']}   Sprouts: {counts['sprouts']}   Flowers: {counts['flowers']}"
+                         f"   Pests: {counts['pests']}   Withering: {counts['withering']}")
+    app.summary.left = 10
+
 def endGame():
-    app.gameOver = True
     finalScore = calculateScore()
+    app.replay.recordScore(finalScore)
     Rect(0, 0, app.cols*app.cellSize, app.rows*app.cellSize, fill='lightgray', opacity=70)
     Label(f"Good Job! Score: {finalScore}", 120, 150, size=20, fill='blue', bold=True)
     Label("(No more actions possible)", 120, 180, size=16, fill='black')
 
 def onMousePress(x, y):
-    if app.gameOver:
+    if app.state.gameOver:
         return
     row = y // app.cellSize
     col = x // app.cellSize
     handleAction(row, col)
 
 def onKeyPress(key):
-    if app.gameOver:
+    # Save the replay log (works after the game is over too)
+    if key == 'l':
+        path = f'garden_{app.seed}.replay'
+        app.replay.save(path)
+        # Shown in the summary line until the next action redraws it
+        app.summary.value = f'Saved replay to {path}'
+        app.summary.left = 10
+        return
+
+    if app.state.gameOver:
         return
 
     if key == 's':
@@ -0,0 +1,174 @@
+# Monte Carlo batch runner for Garden Builder.
+# Plays many seeded games headlessly with gb_engine under a simple policy and
+# reports how the final scores are spread out. Games are split across a
+# multiprocessing pool, so rule changes (maxActions, maxDays, the pest chance)
+# can be tried on hundreds of thousands of games before anyone plays them.
+#
+# Example:
+#   python gb_batch.py --games 200000 --policy all --max-actions 4
+
+import argparse
+import multiprocessing
+import random
+import statistics
+import time
+
+import gb_engine as engine
+import gb_solver
+
+# ---------------------------------------
+# POLICIES
+# A policy looks at the board at the start of a day and returns a list of
+# (mode, row, col) actions in the order it wants to try them. It can list
+# more actions than the daily budget; step_day ignores the extras.
+# ---------------------------------------
+def allCells(state):
+    return [(r, c) for r in range(state.rows) for c in range(state.cols)]
+
+def careActions(state):
+    """Water, pest and fertilizer actions for every plant that can use one"""
+    water = []
+    pests = []
+    fertilize = []
+    for r, c in allCells(state):
+        plant = state.grid[r][c]
+        if plant is None:
+            continue
+        if plant.water_needed > 0:
+            water.append((plant.water_needed, ('water', r, c)))
+        if plant.has_pests:
+            pests.append(('preventPests', r, c))
+        if plant.growth_stage <= 2 and not plant.is_fertilized:
+            fertilize.append(('fertilize', r, c))
+
+    # Thirstiest plants first, since they are closest to dying
+    water.sort(key=lambda item: -item[0])
+    return [action for need, action in water], pests, fertilize
+
+def seedActions(state):
+    return [('seed', r, c) for r, c in allCells(state) if state.grid[r][c] is None]
+
+def waterFirstPolicy(state, rng):
+    """Water everything, then clear pests, then seed, then fertilize"""
+    water, pests, fertilize = careActions(state)
+    return water + pests + seedActions(state) + fertilize
+
+def seedGreedyPolicy(state, rng):
+    """Fill every empty cell before looking after the plants"""
+    water, pests, fertilize = careActions(state)
+    return seedActions(state) + water + pests + fertilize
+
+def randomPolicy(state, rng):
+    """Click random cells with random action modes"""
+    modes = ['seed', 'water', 'fertilize', 'preventPests']
+    clicks = state.maxActions * 4
+    return [(rng.choice(modes), rng.randrange(state.rows), rng.randrange(state.cols))
+            for i in range(clicks)]
+
+# Solvers are slow-ish to build, so each worker keeps one per set of rules
+solvers = {}
+
+def getSolver(state):
+    key = (state.maxDays, state.maxStages, state.maxActions, state.pestChance)
+    if key not in solvers:
+        solvers[key] = gb_solver.GardenSolver(*key)
+        solvers[key].ceiling(state.rows, state.cols)
+    return solvers[key]
+
+def solverPolicy(state, rng):
+    """Split the budget using gb_solver's value tables"""
+    return getSolver(state).chooseActions(state)
+
+POLICIES = {
+    'water-first': waterFirstPolicy,
+    'seed-greedy': seedGreedyPolicy,
+    'random': randomPolicy,
+    'solver': solverPolicy,
+}
+
+# ---------------------------------------
+# RUNNING GAMES
+# ---------------------------------------
+def playGame(seed, policy, rules):
+    """Play one full game and return its final score"""
+    rng = random.Random(seed)
+    policyRng = random.Random(f'policy-{seed}')
+    state = engine.GardenState(**rules)
+    while not state.gameOver:
+        engine.step_day(state, policy(state, policyRng), rng)
+    return engine.calculateScore(state)
+
+def playChunk(job):
+    """Worker entry point: play games for a range of seeds"""
+    policyName, firstSeed, count, rules = job
+    policy = POLICIES[policyName]
+    return [playGame(seed, policy, rules) for seed in range(firstSeed, firstSeed + count)]
+
+def runBatch(policyName, games, rules, seed=0, processes=None, chunkSize=500):
+    """Play games seeded seed, seed+1, ... and return the list of scores"""
+    jobs = []
+    for first in range(seed, seed + games, chunkSize):
+        jobs.append((policyName, first, min(chunkSize, seed + games - first), rules))
+
+    scores = []
+    if processes == 1:
+        for job in jobs:
+            scores.extend(playChunk(job))
+    else:
+        with multiprocessing.Pool(processes) as pool:
+            for chunk in pool.imap(playChunk, jobs):
+                scores.extend(chunk)
+    return scores
+
+def summarize(scores, maxScore):
+    """Mean, spread and a small text histogram of the scores"""
+    ordered = sorted(scores)
+    def percentile(p):
+        return ordered[min(len(ordered) - 1, int(p / 100 * len(ordered)))]
+
+    lines = [
+        f'games: {len(scores)}   mean: {statistics.fmean(scores):.3f}   '
+        f'stdev: {statistics.pstdev(scores):.3f}',
+        f'min: {ordered[0]}   p10: {percentile(10)}   median: {percentile(50)}   '
+        f'p90: {percentile(90)}   max: {ordered[-1]}',
+    ]
+
+    counts = [0] * (maxScore + 1)
+    for score in scores:
+        counts[score] += 1
+    biggest = max(counts)
+    for score in range(ordered[0], ordered[-1] + 1):
+        bar = '#' * round(40 * counts[score] / biggest)
+        lines.append(f'{score:4d} {counts[score] / len(scores):7.2%} {bar}')
+    return '\n'.join(lines)
+
+def main():
+    parser = argparse.ArgumentParser(description='Play many Garden Builder games headlessly.')
+    parser.add_argument('--games', type=int, default=10000)
+    parser.add_argument('--policy', default='all', choices=['all'] + list(POLICIES))
+    parser.add_argument('--seed', type=int, default=0, help='seed of the first game')
+    parser.add_argument('--processes', type=int, default=None, help='worker processes (default: one per CPU)')
+    parser.add_argument('--rows', type=int, default=4)
+    parser.add_argument('--cols', type=int, default=5)
+    parser.add_argument('--max-days', type=int, default=20)
+    parser.add_argument('--max-actions', type=int, default=5)
+    parser.add_argument('--pest-chance', type=float, default=0.2)
+    args = parser.parse_args()
+
+    rules = {'rows': args.rows, 'cols': args.cols, 'maxDays': args.max_days,
+             'maxActions': args.max_actions, 'pestChance': args.pest_chance}
+    policies = list(POLICIES) if args.policy == 'all' else [args.policy]
+
+    for name in policies:
+        start = time.time()
+        scores = runBatch(name, args.games, rules, args.seed, args.processes)
+        elapsed = time.time() - start
+        print(f'== {name} ({elapsed:.1f}s, {args.games / elapsed:.0f} games/s)')
+        print(summarize(scores, args.rows * args.cols))
+        print()
+
+    solver = gb_solver.GardenSolver(args.max_days, 4, args.max_actions, args.pest_chance)
+    print(f'expected score ceiling (gb_solver): {solver.ceiling(args.rows, args.cols):.3f}')
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,288 @@
+# Headless rules engine for Garden Builder.
+# All of the game rules live here so they can run without opening a window.
+# gb.py keeps a GardenState and only draws what is stored in it, which means
+# the same rules can also be used for batch simulations and benchmarks.
+
+import math
+
+class Plant:
+    """Gameplay attributes for one plant.
+    Uses __slots__ so big boards don't pay for a dict per plant; the shapes
+    that draw a plant are kept by the renderer, not here."""
+    __slots__ = ('row', 'col', 'type', 'growth_stage', 'has_pests', 'water_needed',
+                 'is_fertilized', 'days_without_water', 'germination_days')
+
+    def __init__(self, row, col):
+        self.row = row
+        self.col = col
+        self.type = "flower"
+        self.growth_stage = 0
+        self.has_pests = False
+        self.water_needed = 0  # Number of water icons (0-3)
+        self.is_fertilized = False
+        self.days_without_water = 0  # Track consecutive days without water
+        self.germination_days = 0  # Track days as a seed
+
+class GardenState:
+    """Everything the rules need to know about one game"""
+    def __init__(self, rows=4, cols=5, maxDays=20, maxStages=4, maxActions=5, pestChance=0.2):
+        self.rows = rows
+        self.cols = cols
+        self.maxDays = maxDays
+        self.maxStages = maxStages
+        self.maxActions = maxActions
+        self.pestChance = pestChance  # Daily chance for a sprouted plant to get pests
+
+        # Each cell holds a Plant or None
+        self.grid = [[None] * cols for r in range(rows)]
+
+        self.dayCounter = 0
+        self.actionsLeft = maxActions
+        self.gameOver = False
+
+        # Live counters, kept up to date by handleAction and endOfDayUpdate so
+        # the score and board summary never need a full scan
+        self.stageCounts = [0] * (maxStages + 1)  # Plants at each growth stage
+        self.pestCount = 0  # Plants with pests
+        self.thirstyCount = 0  # Plants showing water icons
+        self.witheringCount = 0  # Plants 2+ days without water
+
+        # Cells whose picture changed since the renderer last redrew them,
+        # and how many cells each end of day changed
+        self.dirtyCells = set()
+        self.redrawsPerDay = []
+
+def visualKey(plant):
+    """Everything about a plant that changes how it is drawn"""
+    return (plant.growth_stage, plant.water_needed, plant.has_pests,
+            plant.is_fertilized, min(3, plant.days_without_water))
+
+def countPlant(state, plant, sign):
+    """Add (sign=1) or remove (sign=-1) a plant from the live counters"""
+    state.stageCounts[plant.growth_stage] += sign
+    if plant.has_pests:
+        state.pestCount += sign
+    if plant.water_needed > 0:
+        state.thirstyCount += sign
+    if plant.days_without_water >= 2:
+        state.witheringCount += sign
+
+def boardSummary(state):
+    """How many plants of each kind are on the board right now"""
+    return {
+        'plants': sum(state.stageCounts),
+        'seeds': state.stageCounts[0],
+        'sprouts': state.stageCounts[1],
+        'flowers': state.stageCounts[state.maxStages],
+        'pests': state.pestCount,
+        'thirsty': state.thirstyCount,
+        'withering': state.witheringCount,
+    }
+
+def takeDirtyCells(state):
+    """Return the cells that need redrawing and forget about them"""
+    cells = state.dirtyCells
+    state.dirtyCells = set()
+    return cells
+
+def createPlant(row, col):
+    """Create a new plant at the given cell"""
+    return Plant(row, col)
+
+# Plant functions
+def waterPlant(plant):
+    plant.water_needed = 0  # Remove all water icons
+    plant.days_without_water = 0  # Reset days without water
+
+def fertilizePlant(plant):
+    plant.is_fertilized = True
+
+def removePests(plant):
+    plant.has_pests = False
+
+def addGrowth(state, plant):
+    plant.growth_stage = min(state.maxStages, plant.growth_stage + 1)
+
+def reduceGrowth(plant):
+    plant.growth_stage = max(0, plant.growth_stage - 1)
+
+def isFullyGrown(state, plant):
+    return plant.growth_stage >= state.maxStages
+
+def growPlant(state, plant):
+    """End of day rules for one plant. Returns False if the plant dies."""
+    # Check if plant dies from lack of water
+    if plant.days_without_water >= 3:
+        return False
+
+    # Handle negative effects (only for sprouted plants)
+    if plant.growth_stage > 0 and plant.has_pests:
+        if plant.growth_stage == 1:
+            return False
+        else:
+            reduceGrowth(plant)
+
+    # Handle seed germination
+    if plant.growth_stage == 0:
+        plant.germination_days += 1
+        if plant.germination_days >= 2:  # Sprout after 2 days
+            if plant.days_without_water == 0:
+                plant.growth_stage = 1
+                plant.germination_days = 0
+
+    # Handle normal growth conditions
+    elif plant.days_without_water <= 1 and not plant.has_pests:
+        # Plant grows if not withered and no pests
+        addGrowth(state, plant)
+
+    # Handle fertilizer bonus (can still grow even if withered)
+    if plant.is_fertilized:
+        addGrowth(state, plant)
+
+    return True
+
+def resetDaily(state, plant):
+    """Reset daily attributes and update water status.
+    Pests are rolled for the whole board at once in endOfDayUpdate."""
+    plant.is_fertilized = False
+    plant.days_without_water += 1
+
+    # Update water needs based on days without water
+    if plant.days_without_water >= 1:
+        plant.water_needed = min(3, plant.days_without_water)
+
+def pestRolls(count, chance, rng):
+    """Indices (0 to count-1) of the plants that get pests.
+    Gives the same result as rolling rng.random() < chance for every plant,
+    but jumps straight from one hit to the next (the gap between hits follows
+    a geometric distribution), so it only draws one number per hit."""
+    if chance <= 0:
+        return
+    if chance >= 1:
+        yield from range(count)
+        return
+
+    logMiss = math.log(1 - chance)
+    i = -1
+    while True:
+        i += 1 + int(math.log(1 - rng.random()) / logMiss)
+        if i >= count:
+            return
+        yield i
+
+def plantDies(state, plant):
+    """Remove a plant from the grid (it must already be out of the counters)"""
+    state.grid[plant.row][plant.col] = None
+    state.dirtyCells.add((plant.row, plant.col))
+
+def handleAction(state, row, col, mode, rng):
+    """Apply one action ('seed', 'water', 'fertilize' or 'preventPests') to a cell.
+    Returns True if the action was used. Using the last action ends the day."""
+    if state.gameOver or state.actionsLeft <= 0:  # Check if actions are depleted
+        return False
+    if not (0 <= row < state.rows and 0 <= col < state.cols):
+        return False
+
+    plant = state.grid[row][col]
+    if plant is not None:
+        countPlant(state, plant, -1)
+    actionTaken = False
+
+    if mode == 'seed':
+        if plant is None:
+            plant = createPlant(row, col)
+            state.grid[row][col] = plant
+            actionTaken = True
+    elif plant is not None:
+        if mode == 'water':
+            if plant.water_needed > 0:
+                waterPlant(plant)
+                actionTaken = True
+        elif mode == 'fertilize':
+            if plant.growth_stage <= 2:  # Only count as action if fertilizer can be applied
+                if not plant.is_fertilized:
+                    fertilizePlant(plant)
+                    actionTaken = True
+        elif mode == 'preventPests':
+            if plant.has_pests:  # Only count as action if pests are present
+                removePests(plant)
+                actionTaken = True
+
+    if plant is not None:
+        countPlant(state, plant, 1)
+
+    if actionTaken:
+        state.dirtyCells.add((row, col))
+        state.actionsLeft -= 1
+        if state.actionsLeft <= 0:
+            endOfDayUpdate(state, rng)
+
+    return actionTaken
+
+def endOfDayUpdate(state, rng):
+    """Grow, wither or kill every plant and start the next day"""
+    if state.gameOver:
+        return
+
+    state.dayCounter += 1
+    state.actionsLeft = state.maxActions  # Reset actions for new day
+    changed = 0
+    healthy = []  # Sprouted plants without pests, which can catch them tonight
+
+    for r in range(state.rows):
+        for c in range(state.cols):
+            plant = state.grid[r][c]
+            if plant is not None:
+                before = visualKey(plant)
+                countPlant(state, plant, -1)
+
+                if not growPlant(state, plant):
+                    plantDies(state, plant)
+                    changed += 1
+                    continue
+
+                resetDaily(state, plant)
+                countPlant(state, plant, 1)
+
+                isChanged = visualKey(plant) != before
+                if isChanged:
+                    state.dirtyCells.add((r, c))
+                    changed += 1
+
+                # Only plants that have sprouted (growth_stage > 0) get pests
+                if plant.growth_stage > 0 and not plant.has_pests:
+                    healthy.append((plant, isChanged))
+
+    # One batched pest roll for the whole board
+    for i in pestRolls(len(healthy), state.pestChance, rng):
+        plant, isChanged = healthy[i]
+        plant.has_pests = True
+        state.pestCount += 1
+        if not isChanged:
+            state.dirtyCells.add((plant.row, plant.col))
+            changed += 1
+
+    state.redrawsPerDay.append(changed)
+
+    if state.dayCounter >= state.maxDays:
+        state.gameOver = True
+
+def step_day(state, actions, rng):
+    """Play one whole day headlessly.
+    actions is a list of (mode, row, col) tuples applied in order. Actions left
+    over after the daily budget runs out are ignored. Returns the state."""
+    if state.gameOver:
+        return state
+
+    day = state.dayCounter
+    for mode, row, col in actions:
+        handleAction(state, row, col, mode, rng)
+        if state.dayCounter != day:  # Used the last action, day already ended
+            return state
+
+    endOfDayUpdate(state, rng)
+    return state
+
+def calculateScore(state):
+    """Number of fully grown plants, read from the live counters"""
+    return state.stageCounts[state.maxStages]
@@ -0,0 +1,147 @@
+# Array-backed garden grid for very large boards.
+# Instead of one Plant object per cell, every plant attribute is stored as a
+# typed NumPy array covering the whole board, and the end of day rules are
+# applied to all cells at once with masks. The rules are the same as the ones
+# in gb_engine.py, so step_day and calculateScore give the same results as
+# their gb_engine versions. It is not a drop-in GardenState, though: the
+# random generator must be a NumPy Generator (e.g.
+# numpy.random.default_rng(seed)) rather than a random.Random, and plants are
+# entries in the arrays rather than Plant objects, so gb.py's drawing code
+# and gb_replay can't use it.
+#
+# Needs NumPy.
+
+import numpy as np
+
+EMPTY = -1  # growth_stage value used for cells without a plant
+
+class ArrayGardenState:
+    """Garden state stored as one array per plant attribute"""
+    def __init__(self, rows=4, cols=5, maxDays=20, maxStages=4, maxActions=5, pestChance=0.2):
+        self.rows = rows
+        self.cols = cols
+        self.maxDays = maxDays
+        self.maxStages = maxStages
+        self.maxActions = maxActions
+        self.pestChance = pestChance
+
+        shape = (rows, cols)
+        self.growth_stage = np.full(shape, EMPTY, dtype=np.int8)
+        self.days_without_water = np.zeros(shape, dtype=np.int8)
+        self.germination_days = np.zeros(shape, dtype=np.int16)
+        self.has_pests = np.zeros(shape, dtype=bool)
+        self.is_fertilized = np.zeros(shape, dtype=bool)
+
+        self.dayCounter = 0
+        self.actionsLeft = maxActions
+        self.gameOver = False
+
+def waterNeeded(state):
+    """Water icons for every cell (0-3). Always min(3, days_without_water)."""
+    return np.minimum(3, state.days_without_water)
+
+def clearCells(state, mask):
+    """Remove the plants in every cell of mask"""
+    state.growth_stage[mask] = EMPTY
+    state.days_without_water[mask] = 0
+    state.germination_days[mask] = 0
+    state.has_pests[mask] = False
+    state.is_fertilized[mask] = False
+
+def handleAction(state, row, col, mode, rng):
+    """Same as gb_engine.handleAction, for a single cell"""
+    if state.gameOver or state.actionsLeft <= 0:
+        return False
+    if not (0 <= row < state.rows and 0 <= col < state.cols):
+        return False
+
+    stage = state.growth_stage[row, col]
+    actionTaken = False
+
+    if mode == 'seed':
+        if stage == EMPTY:
+            clearCells(state, (row, col))
+            state.growth_stage[row, col] = 0
+            actionTaken = True
+    elif stage != EMPTY:
+        if mode == 'water':
+            if state.days_without_water[row, col] > 0:
+                state.days_without_water[row, col] = 0
+                actionTaken = True
+        elif mode == 'fertilize':
+            if stage <= 2 and not state.is_fertilized[row, col]:
+                state.is_fertilized[row, col] = True
+                actionTaken = True
+        elif mode == 'preventPests':
+            if state.has_pests[row, col]:
+                state.has_pests[row, col] = False
+                actionTaken = True
+
+    if actionTaken:
+        state.actionsLeft -= 1
+        if state.actionsLeft <= 0:
+            endOfDayUpdate(state, rng)
+
+    return actionTaken
+
+def endOfDayUpdate(state, rng):
+    """Masked version of gb_engine.endOfDayUpdate"""
+    if state.gameOver:
+        return
+
+    state.dayCounter += 1
+    state.actionsLeft = state.maxActions
+
+    stage = state.growth_stage
+    dww = state.days_without_water
+    pests = state.has_pests
+    alive = stage != EMPTY
+
+    # Plants die from lack of water, or from pests while still a sprout
+    pestHit = alive & (stage > 0) & pests
+    dies = alive & ((dww >= 3) | (pestHit & (stage == 1)))
+    clearCells(state, dies)
+    alive &= ~dies
+
+    # Pests set older plants back one stage
+    stage[pestHit & ~dies] -= 1
+
+    # Seeds germinate after 2 days if they were watered
+    seeds = alive & (stage == 0)
+    state.germination_days[seeds] += 1
+    sprout = seeds & (state.germination_days >= 2) & (dww == 0)
+    stage[sprout] = 1
+    state.germination_days[sprout] = 0
+
+    # Normal growth, plus the fertilizer bonus (which works even if withered)
+    grow = alive & ~seeds & (dww <= 1) & ~pests
+    bonus = grow.astype(np.int8) + (alive & state.is_fertilized)
+    np.minimum(stage + bonus, state.maxStages, out=stage, where=alive)
+
+    # Daily reset
+    state.is_fertilized[alive] = False
+    dww[alive] += 1
+
+    # Every sprouted plant has the same daily chance to get pests
+    sprouted = alive & (stage > 0)
+    pests[sprouted] |= rng.random(int(np.count_nonzero(sprouted))) < state.pestChance
+
+    if state.dayCounter >= state.maxDays:
+        state.gameOver = True
+
+def step_day(state, actions, rng):
+    """Same as gb_engine.step_day"""
+    if state.gameOver:
+        return state
+
+    day = state.dayCounter
+    for mode, row, col in actions:
+        handleAction(state, row, col, mode, rng)
+        if state.dayCounter != day:
+            return state
+
+    endOfDayUpdate(state, rng)
+    return state
+
+def calculateScore(state):
+    return int(np.count_nonzero(state.growth_stage >= state.maxStages))
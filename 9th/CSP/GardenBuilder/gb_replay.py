@@ -0,0 +1,101 @@
+# Replay logs for Garden Builder.
+# Every game owns a seeded random.Random, so a game is fully described by its
+# seed, its rules and the list of things the player did. ReplayLog records
+# that list as it happens, and replayGame plays it again headlessly with
+# gb_engine at full CPU speed. Saved replays double as fixed benchmark
+# workloads:
+#
+#   python gb_replay.py garden_1234.replay --repeat 1000
+
+import argparse
+import random
+import time
+
+import gb_engine as engine
+
+# One letter per action, the same keys the player presses in gb.py
+MODE_CODES = {'seed': 's', 'water': 'w', 'fertilize': 'f', 'preventPests': 'x'}
+CODE_MODES = {code: mode for mode, code in MODE_CODES.items()}
+
+class ReplayLog:
+    """Append-only record of one game.
+    Events are short strings: 'w2,3' is a water action on row 2, col 3 and
+    'd' is the player ending the day early."""
+    def __init__(self, seed, rules=None):
+        self.seed = seed
+        self.rules = dict(rules or {})  # Keyword arguments for GardenState
+        self.events = []
+        self.finalScore = None
+
+    def recordAction(self, mode, row, col):
+        self.events.append(f'{MODE_CODES[mode]}{row},{col}')
+
+    def recordEndOfDay(self):
+        self.events.append('d')
+
+    def recordScore(self, score):
+        self.finalScore = score
+
+    def save(self, path):
+        with open(path, 'w') as f:
+            f.write('gardenbuilder-replay 1\n')
+            f.write(f'seed {self.seed}\n')
+            f.write('rules ' + ' '.join(f'{name}={value}' for name, value in self.rules.items()) + '\n')
+            if self.finalScore is not None:
+                f.write(f'score {self.finalScore}\n')
+            f.write('events ' + ' '.join(self.events) + '\n')
+
+def loadReplay(path):
+    log = None
+    rules = {}
+    with open(path) as f:
+        for line in f:
+            name, _, rest = line.strip().partition(' ')
+            if name == 'seed':
+                log = ReplayLog(int(rest))
+            elif name == 'rules':
+                for item in rest.split():
+                    key, value = item.split('=')
+                    rules[key] = float(value) if '.' in value else int(value)
+            elif name == 'score':
+                log.finalScore = int(rest)
+            elif name == 'events':
+                log.events = rest.split()
+    log.rules = rules
+    return log
+
+def newGame(log):
+    """The state and random generator a logged game started with"""
+    return engine.GardenState(**log.rules), random.Random(log.seed)
+
+def replayGame(log):
+    """Play the logged game again and return the final state"""
+    state, rng = newGame(log)
+    for event in log.events:
+        if event == 'd':
+            engine.endOfDayUpdate(state, rng)
+        else:
+            row, col = event[1:].split(',')
+            engine.handleAction(state, int(row), int(col), CODE_MODES[event[0]], rng)
+    return state
+
+def main():
+    parser = argparse.ArgumentParser(description='Replay a saved Garden Builder game headlessly.')
+    parser.add_argument('path')
+    parser.add_argument('--repeat', type=int, default=1, help='play it this many times (for benchmarking)')
+    args = parser.parse_args()
+
+    log = loadReplay(args.path)
+    start = time.time()
+    for i in range(args.repeat):
+        state = replayGame(log)
+    elapsed = time.time() - start
+
+    score = engine.calculateScore(state)
+    print(f'seed {log.seed}, {len(log.events)} events, day {state.dayCounter}, score {score}')
+    if log.finalScore is not None and log.finalScore != score:
+        print(f'MISMATCH: the log recorded a score of {log.finalScore}')
+    print(f'{args.repeat} replays in {elapsed:.3f}s ({elapsed / args.repeat * 1e6:.0f} us each)')
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,266 @@
+# Optimal-play solver for Garden Builder.
+# Plants never affect each other: what happens to a plant only depends on its
+# own (growth_stage, days_without_water, germination_days, has_pests) and on
+# the actions it gets, and the only thing shared between cells is the daily
+# action budget. So the solver works one plant at a time:
+#
+# 1. Every reachable plant state (plus "empty cell") is listed, together with
+#    the outcomes of every set of actions it can get in one day. The outcomes
+#    come from the real rules in gb_engine, so the solver can't drift from
+#    the game.
+# 2. Dynamic programming over the days gives a value table: the chance that a
+#    cell in a given state holds a fully grown flower at the end of the game.
+#    Each action is charged a price for the day it is used on, so that one
+#    cell can't spend more than its fair share of the board's budget.
+# 3. With the best prices, the value tables give an upper bound on the
+#    expected score of ANY strategy (a Lagrangian relaxation of the daily
+#    budget), and each day the budget is split across the board with a small
+#    knapsack.
+#
+# Example:
+#   python gb_solver.py --rows 4 --cols 5
+
+import argparse
+import time
+
+import gb_engine as engine
+
+EMPTY = None  # State key for a cell without a plant
+
+def stateKey(plant):
+    """Small tuple describing everything about a plant that matters for the
+    rest of the game. Any germination count of 1 or more behaves the same."""
+    if plant is None:
+        return EMPTY
+    return (plant.growth_stage, plant.days_without_water,
+            min(1, plant.germination_days), plant.has_pests)
+
+def plantFromKey(key):
+    plant = engine.createPlant(0, 0)
+    if key is not EMPTY:
+        stage, dry, germination, pests = key
+        plant.growth_stage = stage
+        plant.days_without_water = dry
+        plant.water_needed = min(3, dry)
+        plant.germination_days = germination
+        plant.has_pests = pests
+    return plant
+
+def usefulActions(rules, key):
+    """Every set of actions that would be accepted for a cell in this state"""
+    if key is EMPTY:
+        return [(), ('seed',), ('seed', 'fertilize')]
+
+    plant = plantFromKey(key)
+    single = []
+    if plant.water_needed > 0:
+        single.append('water')
+    if plant.growth_stage <= 2:
+        single.append('fertilize')
+    if plant.has_pests:
+        single.append('preventPests')
+
+    sets = [()]
+    for action in single:
+        sets += [actions + (action,) for actions in sets]
+    return sets
+
+def dayOutcomes(rules, key, actions):
+    """List of (probability, next key) after a day with these actions"""
+    if key is EMPTY and 'seed' not in actions:
+        return [(1.0, EMPTY)]
+
+    plant = plantFromKey(key)
+    if 'water' in actions:
+        engine.waterPlant(plant)
+    if 'fertilize' in actions:
+        engine.fertilizePlant(plant)
+    if 'preventPests' in actions:
+        engine.removePests(plant)
+
+    if not engine.growPlant(rules, plant):
+        return [(1.0, EMPTY)]
+    engine.resetDaily(rules, plant)
+
+    key = stateKey(plant)
+    if plant.growth_stage > 0 and not plant.has_pests and rules.pestChance > 0:
+        plant.has_pests = True
+        return [(1 - rules.pestChance, key), (rules.pestChance, stateKey(plant))]
+    return [(1.0, key)]
+
+class GardenSolver:
+    """Per-plant value tables for one set of rules"""
+    def __init__(self, maxDays=20, maxStages=4, maxActions=5, pestChance=0.2):
+        self.rules = engine.GardenState(1, 1, maxDays, maxStages, maxActions, pestChance)
+        self.maxDays = maxDays
+        self.maxActions = maxActions
+
+        # Find every reachable state and its choices:
+        # choices[key] = [(actions, cost, [(probability, next key), ...]), ...]
+        self.choices = {}
+        todo = [EMPTY]
+        while todo:
+            key = todo.pop()
+            if key in self.choices:
+                continue
+            self.choices[key] = []
+            for actions in usefulActions(self.rules, key):
+                outcomes = dayOutcomes(self.rules, key, actions)
+                self.choices[key].append((actions, len(actions), outcomes))
+                todo += [nextKey for p, nextKey in outcomes if nextKey not in self.choices]
+
+        self.prices = [0.0] * maxDays
+        self.tables, self.plan = self.valueTables(self.prices)
+
+    def finalValue(self, key):
+        if key is EMPTY:
+            return 0.0
+        return 1.0 if key[0] >= self.rules.maxStages else 0.0
+
+    def valueTables(self, prices):
+        """tables[day][key] = best expected flowers from this cell, starting at
+        the beginning of that day, when every action on day d costs prices[d].
+        plan[day][key] = the option (index into choices[key]) that achieves it."""
+        tables = [None] * (self.maxDays + 1)
+        plan = [None] * self.maxDays
+        tables[self.maxDays] = {key: self.finalValue(key) for key in self.choices}
+        for day in range(self.maxDays - 1, -1, -1):
+            after = tables[day + 1]
+            table = {}
+            picks = {}
+            for key, options in self.choices.items():
+                best = None
+                for i in range(len(options)):
+                    actions, cost, outcomes = options[i]
+                    value = -prices[day] * cost
+                    for p, nextKey in outcomes:
+                        value += p * after[nextKey]
+                    if best is None or value > best + 1e-12:
+                        best = value
+                        picks[key] = i
+                table[key] = best
+            tables[day] = table
+            plan[day] = picks
+        return tables, plan
+
+    def expectedUse(self, keys, plan):
+        """Expected actions used on each day if every cell follows plan"""
+        counts = {}
+        for key in keys:
+            counts[key] = counts.get(key, 0) + 1
+
+        use = []
+        for day in range(self.maxDays):
+            used = 0.0
+            nextCounts = {}
+            for key, count in counts.items():
+                actions, cost, outcomes = self.choices[key][plan[day][key]]
+                used += count * cost
+                for p, nextKey in outcomes:
+                    nextCounts[nextKey] = nextCounts.get(nextKey, 0) + count * p
+            use.append(used)
+            counts = nextCounts
+        return use
+
+    def bound(self, keys, prices, tables):
+        return sum(tables[0][key] for key in keys) + self.maxActions * sum(prices)
+
+    def solve(self, keys, iterations=100):
+        """Find daily action prices giving the lowest upper bound for a board
+        whose cells start in these states. Returns the score ceiling and keeps
+        the matching tables for chooseActions.
+
+        For any prices >= 0 the bound is at least the expected score of every
+        strategy that keeps to the daily budget. It is convex in the prices,
+        so they are tuned with projected subgradient steps."""
+        prices = [0.0] * self.maxDays
+        bestBound = None
+        for i in range(iterations):
+            tables, plan = self.valueTables(prices)
+            value = self.bound(keys, prices, tables)
+            if bestBound is None or value < bestBound:
+                bestBound = value
+                self.prices, self.tables, self.plan = prices, tables, plan
+
+            # Days that plan more actions than the budget get more expensive
+            use = self.expectedUse(keys, plan)
+            slack = [self.maxActions - used for used in use]
+            size = sum(g * g for g in slack) ** 0.5
+            if size == 0:
+                break
+            step = 0.2 / (i + 1) ** 0.5
+            prices = [max(0.0, prices[d] - step * slack[d] / size) for d in range(self.maxDays)]
+
+        return bestBound
+
+    def ceiling(self, rows, cols):
+        """Upper bound on the expected final score of any strategy"""
+        return self.solve([EMPTY] * (rows * cols))
+
+    def chooseActions(self, state):
+        """Split today's action budget across the board to maximise the
+        expected number of fully grown plants. Returns (mode, row, col) actions."""
+        after = self.tables[min(state.dayCounter + 1, self.maxDays)]
+        budget = state.actionsLeft
+
+        # Multiple-choice knapsack: each cell picks one set of actions
+        best = [0.0] * (budget + 1)
+        picks = []
+        for r in range(state.rows):
+            for c in range(state.cols):
+                options = self.choices.get(stateKey(state.grid[r][c]))
+                if options is None:
+                    continue
+                values = []
+                for actions, cost, outcomes in options:
+                    values.append(sum(p * after[nextKey] for p, nextKey in outcomes))
+                gains = [(values[i] - values[0], i) for i in range(1, len(options))
+                         if values[i] > values[0] + 1e-12 and options[i][1] <= budget]
+                if not gains:
+                    continue
+
+                newBest = best[:]
+                choice = [0] * (budget + 1)
+                for gain, i in gains:
+                    cost = options[i][1]
+                    for b in range(budget, cost - 1, -1):
+                        if best[b - cost] + gain > newBest[b]:
+                            newBest[b] = best[b - cost] + gain
+                            choice[b] = i
+                best = newBest
+                picks.append((r, c, options, choice))
+
+        # Walk back through the cells to find which option each one got
+        actions = []
+        b = max(range(budget + 1), key=lambda i: best[i])
+        for r, c, options, choice in reversed(picks):
+            i = choice[b]
+            if i:
+                for mode in options[i][0]:
+                    actions.append((mode, r, c))
+                b -= options[i][1]
+        return actions
+
+    def policy(self, state, rng):
+        """chooseActions in the shape gb_batch expects from a policy"""
+        return self.chooseActions(state)
+
+def main():
+    parser = argparse.ArgumentParser(description='Score ceiling for Garden Builder.')
+    parser.add_argument('--rows', type=int, default=4)
+    parser.add_argument('--cols', type=int, default=5)
+    parser.add_argument('--max-days', type=int, default=20)
+    parser.add_argument('--max-actions', type=int, default=5)
+    parser.add_argument('--pest-chance', type=float, default=0.2)
+    args = parser.parse_args()
+
+    start = time.time()
+    solver = GardenSolver(args.max_days, 4, args.max_actions, args.pest_chance)
+    bound = solver.ceiling(args.rows, args.cols)
+    elapsed = time.time() - start
+    print(f'{len(solver.choices)} plant states, solved in {elapsed * 1000:.0f} ms')
+    print('daily action prices: ' + ' '.join(f'{price:.3f}' for price in solver.prices))
+    print(f'expected score ceiling: {bound:.3f} of {args.rows * args.cols}')
+
+if __name__ == '__main__':
+    main()